@@ -4,37 +4,180 @@
 # Run with: python OpenAIYouTubeTranscriber.py
 
 
+import collections
+import functools
 import importlib.util
 import os
 import re
 import shutil
 import subprocess
 import sys
-from dataclasses import dataclass, field
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from urllib.parse import urlparse
 
-import whisper
-try:
-    from moviepy import VideoFileClip  # moviepy 2.x
-except ImportError:  # moviepy 1.x exposes it via the editor module
-    from moviepy.editor import VideoFileClip
-from langdetect import detect, LangDetectException
+import requests
 from pytubefix import YouTube
 from pytubefix.exceptions import RegexMatchError, VideoUnavailable, VideoPrivate, VideoRegionBlocked
-from dotenv import load_dotenv
+from dotenv import dotenv_values, load_dotenv
 from tenacity import retry, stop_after_attempt, wait_fixed, retry_if_exception_type
 
 
+class _FilenameCharTable(dict):
+    """str.translate table that drops characters not allowed in filenames.
+
+    Entries are filled in lazily on first sight of each code point, so the
+    table covers all of Unicode with str.isalnum() semantics while the
+    per-character work after that happens inside translate's C loop.
+    """
+
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        self[codepoint] = codepoint if char.isalnum() or char in "._- " else None
+        return self[codepoint]
+
+
+_FILENAME_CHARS = _FilenameCharTable()
+
+
+class _ResolutionHeights(dict):
+    """Stream resolution string ('1080p') -> pixel height, for sorting streams.
+
+    Seeded with the usual YouTube heights; anything else is parsed once on
+    first sight. A missing resolution (audio-only streams) ranks as 0.
+    """
+
+    def __missing__(self, resolution):
+        self[resolution] = int(resolution[:-1]) if resolution else 0  # [:-1] strips 'p'
+        return self[resolution]
+
+
+_RESOLUTION_HEIGHTS = _ResolutionHeights(
+    {f"{height}p": height for height in (144, 240, 360, 480, 720, 1080, 1440, 2160, 4320)})
+
+_YT_ID_RE = re.compile(r'^[a-zA-Z0-9_-]{11}$')
+# Video ID inside a watch/short/embed URL; the same pattern pytubefix's extract.video_id uses
+_YT_URL_ID_RE = re.compile(r'(?:v=|/)([0-9A-Za-z_-]{11})')
+# Sentence boundary for chunk_text, and the reasoning block some local models emit
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_THINK_BLOCK_RE = re.compile(r'<think>.*?</think>', re.DOTALL)
+# Case and punctuation ignored when matching words across window overlaps
+_WORD_PUNCT_RE = re.compile(r"[^\w']+")
+# Media extensions is_valid_media_file accepts without running ffprobe
+_MEDIA_EXTENSIONS = frozenset({
+    '.mp3', '.mp4', '.wav', '.avi', '.mov', '.mkv', '.flac', '.ogg', '.m4a', '.webm',
+})
+_YT_HOSTS = frozenset({
+    'youtube.com', 'www.youtube.com', 'm.youtube.com', 'music.youtube.com', 'youtu.be',
+    'youtube-nocookie.com', 'www.youtube-nocookie.com',
+})
+
+
+# whisper.tokenizer.LANGUAGES plus the extra names in its TO_LANGUAGE_CODE. Copied
+# here because importing whisper loads PyTorch, which the faster-whisper path avoids.
+_WHISPER_LANGUAGES = {
+    'en': 'english', 'zh': 'chinese', 'de': 'german', 'es': 'spanish', 'ru': 'russian',
+    'ko': 'korean', 'fr': 'french', 'ja': 'japanese', 'pt': 'portuguese', 'tr': 'turkish',
+    'pl': 'polish', 'ca': 'catalan', 'nl': 'dutch', 'ar': 'arabic', 'sv': 'swedish',
+    'it': 'italian', 'id': 'indonesian', 'hi': 'hindi', 'fi': 'finnish', 'vi': 'vietnamese',
+    'he': 'hebrew', 'uk': 'ukrainian', 'el': 'greek', 'ms': 'malay', 'cs': 'czech',
+    'ro': 'romanian', 'da': 'danish', 'hu': 'hungarian', 'ta': 'tamil', 'no': 'norwegian',
+    'th': 'thai', 'ur': 'urdu', 'hr': 'croatian', 'bg': 'bulgarian', 'lt': 'lithuanian',
+    'la': 'latin', 'mi': 'maori', 'ml': 'malayalam', 'cy': 'welsh', 'sk': 'slovak', 'te': 'telugu',
+    'fa': 'persian', 'lv': 'latvian', 'bn': 'bengali', 'sr': 'serbian', 'az': 'azerbaijani',
+    'sl': 'slovenian', 'kn': 'kannada', 'et': 'estonian', 'mk': 'macedonian', 'br': 'breton',
+    'eu': 'basque', 'is': 'icelandic', 'hy': 'armenian', 'ne': 'nepali', 'mn': 'mongolian',
+    'bs': 'bosnian', 'kk': 'kazakh', 'sq': 'albanian', 'sw': 'swahili', 'gl': 'galician',
+    'mr': 'marathi', 'pa': 'punjabi', 'si': 'sinhala', 'km': 'khmer', 'sn': 'shona',
+    'yo': 'yoruba', 'so': 'somali', 'af': 'afrikaans', 'oc': 'occitan', 'ka': 'georgian',
+    'be': 'belarusian', 'tg': 'tajik', 'sd': 'sindhi', 'gu': 'gujarati', 'am': 'amharic',
+    'yi': 'yiddish', 'lo': 'lao', 'uz': 'uzbek', 'fo': 'faroese', 'ht': 'haitian creole',
+    'ps': 'pashto', 'tk': 'turkmen', 'nn': 'nynorsk', 'mt': 'maltese', 'sa': 'sanskrit',
+    'lb': 'luxembourgish', 'my': 'myanmar', 'bo': 'tibetan', 'tl': 'tagalog', 'mg': 'malagasy',
+    'as': 'assamese', 'tt': 'tatar', 'haw': 'hawaiian', 'ln': 'lingala', 'ha': 'hausa',
+    'ba': 'bashkir', 'jw': 'javanese', 'su': 'sundanese', 'yue': 'cantonese',
+}
+_WHISPER_LANGUAGE_ALIASES = {
+    'burmese': 'my', 'valencian': 'ca', 'flemish': 'nl', 'haitian': 'ht', 'letzeburgesch': 'lb',
+    'pushto': 'ps', 'panjabi': 'pa', 'moldavian': 'ro', 'moldovan': 'ro', 'sinhalese': 'si',
+    'castilian': 'es', 'mandarin': 'zh',
+}
+_LANGUAGE_CODES = frozenset(_WHISPER_LANGUAGES)
+_LANGUAGE_NAME_CODES = {
+    **{name: code for code, name in _WHISPER_LANGUAGES.items()}, **_WHISPER_LANGUAGE_ALIASES,
+}
+# Capitalized names for messages ('es' -> 'Spanish')
+_LANGUAGE_DISPLAY_NAMES = {code: name.capitalize() for code, name in _WHISPER_LANGUAGES.items()}
+
+
+def _language_code(value):
+    """Whisper language code for a code or name in any case ('ES', 'spanish'), else None."""
+    value = value.strip().lower()
+    if value in _LANGUAGE_CODES:
+        return value
+    return _LANGUAGE_NAME_CODES.get(value)
+
+
+@functools.lru_cache(maxsize=None)
+def _stdin_is_tty():
+    """Whether stdin is an interactive terminal, checked once per process."""
+    return sys.stdin.isatty()
+
+
+def _read_input(prompt=''):
+    """input(), minus its per-call stdout+stderr flushing when stdin is piped.
+
+    Terminals keep the built-in input() for its readline line editing; scripted
+    (piped) sessions just write the prompt and read a line.
+    """
+    if _stdin_is_tty():
+        return input(prompt)
+    if prompt:
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line[:-1] if line.endswith('\n') else line
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_format(file_path, mtime, size):
+    """Run ffprobe for the container format. mtime and size key the cache to the file's contents."""
+    try:
+        cmd = [
+            'ffprobe', '-v', 'error',
+            '-show_entries', 'format=format_name',
+            '-of', 'default=noprint_wrappers=1:nokey=1',
+            file_path
+        ]
+        result = subprocess.run(
+            cmd, capture_output=True, text=True, check=True
+        )
+        return result.stdout.strip()
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        print(f"Error with ffprobe: {str(e)}")
+        return None
+
+
 class YesNo(Enum):
     """Accepted spellings for yes/no/skip answers."""
-    YES = ('y', 'yes', 'true', 't', '1')
-    NO = ('n', 'no', 'false', 'f', '0')
-    SKIP = ('skip', 's')
+    YES = frozenset(('y', 'yes', 'true', 't', '1'))
+    NO = frozenset(('n', 'no', 'false', 'f', '0'))
+    SKIP = frozenset(('skip', 's'))
 
     @classmethod
     def all_no_and_skip(cls):
-        return cls.NO.value + cls.SKIP.value
+        return _NO_OR_SKIP
+
+
+# Unions of the YesNo answer sets, built once for the prompt loops
+_YES_OR_NO = YesNo.YES.value | YesNo.NO.value
+_NO_OR_SKIP = YesNo.NO.value | YesNo.SKIP.value
+_ANY_ANSWER = _YES_OR_NO | YesNo.SKIP.value
 
 
 class Resolution(Enum):
@@ -49,6 +192,12 @@ class Resolution(Enum):
         return [item.value for item in cls]
 
 
+# Keyword membership set for the resolution prompt and RESOLUTION profile field
+_RESOLUTION_VALUES = frozenset(Resolution.values())
+# A numeric resolution with optional 'p' suffix ('720' or '720p'), parsed in one pass
+_RESOLUTION_RE = re.compile(r'(\d+)p?')
+
+
 class ModelSize(Enum):
     """Whisper model sizes."""
     TINY = 'tiny'
@@ -79,7 +228,7 @@ class ModelSize(Enum):
     @classmethod
     def valid_choices(cls):
         """Every accepted non-empty model choice: menu numbers and model names."""
-        return cls.choice_numbers() + tuple(cls.all_model_values())
+        return _VALID_MODEL_CHOICES
 
     @classmethod
     def get_model_by_number(cls, number):
@@ -100,11 +249,22 @@ class ModelSize(Enum):
     @classmethod
     def from_choice(cls, choice):
         """Resolve a menu number, model name, or blank string to a ModelSize."""
-        if not choice:
-            return cls.BASE
-        if choice in cls.choice_numbers():
-            return cls.get_model_by_number(choice)
-        return cls.get_model_by_name(choice)
+        return _MODEL_CHOICES.get(choice, cls.BASE)
+
+
+# Menu number or model name -> ModelSize, for a single-lookup ModelSize.from_choice
+_MODEL_CHOICES = {
+    **{number: model for number, model in zip(ModelSize.choice_numbers(), ModelSize)},
+    **{model.value: model for model in ModelSize},
+}
+_VALID_MODEL_CHOICES = frozenset(_MODEL_CHOICES)
+# Sizes with an English-only (.en) variant, as enums and as model names
+_STANDARD_MODELS = frozenset(ModelSize.standard_models())
+_STANDARD_MODEL_NAMES = frozenset(model.value for model in _STANDARD_MODELS)
+# Blank picks the default model at the interactive prompt
+_MODEL_PROMPT_ANSWERS = _VALID_MODEL_CHOICES | {''}
+# The only models whisper_trt can build, all English-only
+_TENSORRT_MODELS = frozenset({'tiny.en', 'base.en', 'small.en'})
 
 
 class Provider(Enum):
@@ -205,6 +365,102 @@ class LocalModel(Enum):
         return cls.default()
 
 
+class WhisperBackend(Enum):
+    """Engines that can run the Whisper models for transcription.
+
+    FASTER_WHISPER runs them through CTranslate2 (fused kernels, INT8 weights)
+    and is several times faster than the reference openai-whisper (WHISPER)
+    PyTorch implementation at the same accuracy. TENSORRT compiles the model
+    into fp16 TensorRT engines for NVIDIA GPUs; it is opt-in only, as it
+    supports just the tiny/base/small models and English output. ONNX exports
+    the model through Hugging Face optimum and runs it on ONNX Runtime, with
+    IO binding on CUDA so tensors stay on the GPU between decoder steps.
+    """
+    FASTER_WHISPER = ('faster-whisper', 'faster_whisper')
+    WHISPER = ('whisper', 'whisper')
+    # Never auto-selected: WHISPER, a hard dependency, always comes first
+    TENSORRT = ('tensorrt', 'whisper_trt')
+    ONNX = ('onnx', 'optimum.onnxruntime')
+
+    def __init__(self, key, module_name):
+        self.key = key
+        self.module_name = module_name
+
+    def is_installed(self):
+        """True if the Python package backing this engine can be imported and used here."""
+        try:
+            if importlib.util.find_spec(self.module_name) is None:
+                return False
+        except ModuleNotFoundError:  # parent package of a dotted module name is missing
+            return False
+        if self is WhisperBackend.TENSORRT:
+            # TensorRT engines only run on NVIDIA GPUs
+            import torch
+            return torch.cuda.is_available()
+        return True
+
+    @classmethod
+    def from_string(cls, value):
+        """Look up a WhisperBackend by its key (e.g. 'whisper'). Returns None if no match."""
+        if not value:
+            return None
+        lower = value.lower().strip()
+        for backend in cls:
+            if lower == backend.key:
+                return backend
+        return None
+
+    def model_name_for(self, model_name, target_language):
+        """Name `model_name` loads under with this backend, or None if it can't run it.
+
+        whisper_trt only builds the English tiny/base/small models, so TENSORRT
+        takes 'base' as 'base.en' and turns down larger models or other languages.
+        """
+        if self is not WhisperBackend.TENSORRT:
+            return model_name
+        if target_language != "en":
+            return None
+        english_name = model_name if model_name.endswith(".en") else f"{model_name}.en"
+        return english_name if english_name in _TENSORRT_MODELS else None
+
+    @classmethod
+    def resolve(cls, model_name, target_language):
+        """Backend to use and the model name to load with it.
+
+        The WHISPER_BACKEND env override wins if it is installed and can run
+        the model in target_language; otherwise the fastest installed one.
+
+        Returns:
+            tuple: (WhisperBackend, model name to load).
+        """
+        requested = os.getenv("WHISPER_BACKEND")
+        backend = cls.from_string(requested)
+        if backend is not None and backend.is_installed():
+            load_name = backend.model_name_for(model_name, target_language)
+            if load_name is not None:
+                return backend, load_name
+            print(f"Warning: Whisper backend '{backend.key}' can't run model '{model_name}' "
+                  f"in '{target_language}'. Using the default backend.")
+        elif requested:
+            print(f"Warning: Whisper backend '{requested}' is unknown or not installed. "
+                  "Using the default backend.")
+        for backend in cls:
+            if backend.is_installed():
+                load_name = backend.model_name_for(model_name, target_language)
+                if load_name is not None:
+                    return backend, load_name
+        return cls.WHISPER, model_name
+
+
+class SourceKind(Enum):
+    """What a user-supplied source string refers to (see YouTubeTranscriber.classify_source)."""
+    VIDEO_ID = 'video_id'
+    YOUTUBE_URL = 'youtube_url'
+    OTHER_WEB_URL = 'other_web_url'
+    LOCAL_FILE = 'local_file'
+    INVALID = 'invalid'
+
+
 class YouTubeTranscriber:
     """Handles YouTube downloads, Whisper transcription, and AI enhancement."""
 
@@ -216,15 +472,23 @@ class YouTubeTranscriber:
     TRANSCRIPT_DIR = os.path.join(DATA_DIR, "Transcript")
     VIDEO_WITHOUT_AUDIO_DIR = os.path.join(DATA_DIR, "VideoWithoutAudio")
     PROFILE_DIR = os.path.join(DATA_DIR, "Profile")
+    # PROFILE_DIR plus separator, so profile_path() is a plain concatenation
+    _PROFILE_DIR_PREFIX = os.path.join(PROFILE_DIR, "")
     PROMPT_DIR = os.path.join(DATA_DIR, "Prompt")
     MP3_EXT = ".mp3"
     MP4_EXT = ".mp4"
+    # Matroska audio holds any codec, so a video's audio track can be copied into it as-is
+    MKA_EXT = ".mka"
     TXT_EXT = ".txt"
     PROFILE_PREFIX = "profile"
     ENV_EXT = ".txt"
     CONFIG_ENV = f"config{ENV_EXT}"
     PROFILE_NAME_TEMPLATE = f"{PROFILE_PREFIX}{{}}{ENV_EXT}"
     DEFAULT_PROFILE = f"{PROFILE_PREFIX}{ENV_EXT}"
+    # profile.txt, profile<number>.txt, profile-<desc>.txt, profile<number>-<desc>.txt
+    PROFILE_RE = re.compile(rf"^{re.escape(PROFILE_PREFIX)}(?:\d+)?(?:-.*)?{re.escape(ENV_EXT)}$")
+    PROFILE_NUMBER_RE = re.compile(
+        rf"^{re.escape(PROFILE_PREFIX)}(?P<num>\d+)(?:-.*)?{re.escape(ENV_EXT)}$")
     URL_PLACEHOLDER = "<Insert_YouTube_link_or_local_path_to_audio_or_video>"
     DEFAULT_LANGUAGE = 'en'
     DEFAULT_SOURCE_PROMPT = "Enter the YouTube video URL, video ID, or local file path: "
@@ -233,6 +497,27 @@ class YouTubeTranscriber:
     # max_tokens is required by the Anthropic API (no SDK default); per-chunk value
     # is sized off the chunk itself (see enhance_with_anthropic), capped here
     ANTHROPIC_MAX_OUTPUT_TOKENS = 8192
+    # Loaded Whisper models keyed by (backend, model_name, device), least recently
+    # used first. Class-level so every YouTubeTranscriber in the process shares
+    # them. Reentrant so _evict_models can run from inside _load_whisper_model.
+    _model_cache = {}
+    _model_lock = threading.RLock()
+    # Models kept loaded at once; older ones are evicted to free (V)RAM
+    MODEL_CACHE_SIZE = 2
+    # Audio chunks decoded together by the batched pipelines (GPU and CPU)
+    WHISPER_BATCH_SIZE = 16
+    WHISPER_CPU_BATCH_SIZE = 8
+    # Overlap between consecutive 30-second windows in the batched long-audio decode
+    WINDOW_OVERLAP_SECONDS = 1
+    # transcribe()'s defaults for retrying a window at higher temperature, and for
+    # dropping one as silence
+    WINDOW_FALLBACK_TEMPERATURES = (0.2, 0.4, 0.6, 0.8, 1.0)
+    COMPRESSION_RATIO_THRESHOLD = 2.4
+    LOGPROB_THRESHOLD = -1.0
+    NO_SPEECH_THRESHOLD = 0.6
+    # Parallel stream downloads: byte-range size and concurrent connections per stream
+    DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+    DOWNLOAD_CONNECTIONS = 8
 
     # Default field values for profile creation (declaration order == profile file order)
     DEFAULT_FIELDS = {
@@ -250,7 +535,17 @@ class YouTubeTranscriber:
         "REPEAT": ""
     }
 
+    # directory -> (time.monotonic() stamp, free bytes) for get_free_disk_space
+    _free_space_cache = {}
+    FREE_SPACE_TTL = 60
+    # Combined videos smaller than this skip the free-space check
+    FREE_SPACE_CHECK_MIN = 10 * 1024 * 1024
+
     def __init__(self):
+        # URL -> YouTube object built by get_youtube_object, handed on to create_youtube_object
+        self._youtube_objects = {}
+        # URL -> thread warming that object's metadata, see prefetch_metadata_async
+        self._metadata_threads = {}
         self._create_required_dirs()
 
     def _create_required_dirs(self):
@@ -279,7 +574,7 @@ class YouTubeTranscriber:
         """Check if string is a valid http/https URL (no network calls)."""
         try:
             result = urlparse(input_str)
-            return all([result.scheme in ['http', 'https'], result.netloc])
+            return result.scheme in ('http', 'https') and bool(result.netloc)
         except ValueError:
             return False
 
@@ -287,58 +582,46 @@ class YouTubeTranscriber:
         """Check if text is a valid 11-character YouTube video ID (letters, numbers, dash, underscore only)."""
         if len(text) != 11:
             return False
-        return bool(re.match(r'^[a-zA-Z0-9_-]{11}$', text))
+        return bool(_YT_ID_RE.match(text))
 
     def construct_youtube_url(self, video_id):
         """Build full YouTube URL from video ID. Query params get stripped by pytubefix automatically."""
         return f"https://www.youtube.com/watch?v={video_id}"
 
     def is_youtube_url(self, url):
-        """Validate YouTube URL using pytubefix. Extracts video ID from any format (standard, short, embed URLs)."""
-        try:
-            YouTube(url, "WEB")
-            return True
-        except (RegexMatchError, VideoUnavailable, VideoPrivate, VideoRegionBlocked):
-            return False
-        except (ValueError, OSError) as e:
-            print(f"Warning: Error checking YouTube URL: {str(e)}")
+        """Validate YouTube URL by host and video ID (standard, short, embed URLs).
+
+        No network access.
+        """
+        if (urlparse(url).hostname or "") not in _YT_HOSTS:
             return False
+        return _YT_URL_ID_RE.search(url) is not None
 
     def is_valid_media_file(self, path):
         """Check if path is a supported audio/video file."""
         if not os.path.exists(path):
             return False
 
-        format_name = self.get_file_format(path)
-        if format_name is not None:
+        # A known extension settles it without spawning ffprobe
+        if os.path.splitext(path)[1].lower() in _MEDIA_EXTENSIONS:
             return True
 
-        valid_extensions = ['.mp3', '.mp4', '.wav', '.avi', '.mov', '.mkv', '.flac', '.ogg', '.m4a', '.webm']
-        file_ext = os.path.splitext(path)[1].lower()
-        return file_ext in valid_extensions
+        return self.get_file_format(path) is not None
 
     def get_file_format(self, file_path):
-        """Get media format using ffprobe."""
+        """Get media format using ffprobe (cached until the file changes)."""
         try:
-            cmd = [
-                'ffprobe', '-v', 'error',
-                '-show_entries', 'format=format_name',
-                '-of', 'default=noprint_wrappers=1:nokey=1',
-                file_path
-            ]
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, check=True
-            )
-            return result.stdout.strip()
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            stat = os.stat(file_path)
+        except OSError as e:
             print(f"Error with ffprobe: {str(e)}")
             return None
+        return _probe_format(file_path, stat.st_mtime, stat.st_size)
 
 
     def get_yes_no_input(self, prompt_text, default="y"):
         """Prompt user for yes/no input with validation."""
         while True:
-            user_input = input(prompt_text).strip().lower()
+            user_input = _read_input(prompt_text).strip().lower()
             if user_input in YesNo.YES.value:
                 return True
             elif user_input in YesNo.NO.value:
@@ -346,7 +629,7 @@ class YouTubeTranscriber:
             elif user_input == "":
                 return default == 'y'
             else:
-                print(f"Invalid input. Please enter one of {YesNo.YES.value + YesNo.NO.value}.")
+                print(f"Invalid input. Please enter one of {sorted(_YES_OR_NO)}.")
 
     def prompt_for_source(self, prompt_text=None):
         """Prompt until the user enters a valid YouTube URL, video ID, or local media path.
@@ -357,25 +640,40 @@ class YouTubeTranscriber:
         if prompt_text is None:
             prompt_text = self.DEFAULT_SOURCE_PROMPT
         while True:
-            url = input(prompt_text).strip()
-            # An existing local file wins over an ID-lookalike filename
-            if self.is_youtube_video_id(url) and not os.path.exists(url):
-                url = self.construct_youtube_url(url)
+            kind, url = self.classify_source(_read_input(prompt_text).strip())
+            if kind == SourceKind.VIDEO_ID:
                 print(f"Detected video ID, using: {url}")
                 return url, False
-            if self.is_web_url(url):
-                if self.is_youtube_url(url):
-                    return url, False
-                print("Error: Only YouTube URLs supported for web inputs")
-            elif self.is_valid_media_file(url):
+            if kind == SourceKind.YOUTUBE_URL:
+                return url, False
+            if kind == SourceKind.LOCAL_FILE:
                 return url, True
+            if kind == SourceKind.OTHER_WEB_URL:
+                print("Error: Only YouTube URLs supported for web inputs")
             else:
                 print("Invalid input. Please enter valid YouTube URL, video ID, or local file path")
 
+    def classify_source(self, text):
+        """Work out what a source string refers to, running each check at most once.
+
+        Returns:
+            tuple: (SourceKind, url), with a bare video ID expanded to a watch URL.
+        """
+        # An existing local file wins over an ID-lookalike filename
+        if self.is_youtube_video_id(text) and not os.path.exists(text):
+            return SourceKind.VIDEO_ID, self.construct_youtube_url(text)
+        if self.is_web_url(text):
+            if self.is_youtube_url(text):
+                return SourceKind.YOUTUBE_URL, text
+            return SourceKind.OTHER_WEB_URL, text
+        if self.is_valid_media_file(text):
+            return SourceKind.LOCAL_FILE, text
+        return SourceKind.INVALID, text
+
     def get_model_choice_input(self):
         """Prompt for Whisper model selection (1-7 or name)."""
         while True:
-            model_choice = input("Select Whisper model:\n"
+            model_choice = _read_input("Select Whisper model:\n"
                                "1. Tiny\n"
                                "2. Base\n"
                                "3. Small\n"
@@ -384,29 +682,31 @@ class YouTubeTranscriber:
                                "6. Large-v2\n"
                                "7. Large-v3\n"
                                "Enter your choice (1-7 or model name, default Base): ").strip().lower()
-            if model_choice in ModelSize.valid_choices() + ('',):
+            if model_choice in _MODEL_PROMPT_ANSWERS:
                 return model_choice
             else:
                 print("Invalid input. Please enter a valid model choice or number (1-7).")
 
     def get_target_language_input(self):
-        """Prompt for target language (validates against Whisper's supported list)."""
+        """Prompt for target language (validates against Whisper's supported list).
+
+        Names and any casing are returned as the lowercase code, the only form
+        faster-whisper accepts.
+        """
         while True:
             prompt = (
                 "Enter the target language for transcription (e.g., 'es' or 'spanish', "
                 f"default '{self.DEFAULT_LANGUAGE}'). See supported languages at "
                 "https://github.com/openai/whisper#supported-languages): "
             )
-            target_language = input(prompt).strip().lower()
+            target_language = _read_input(prompt).strip()
 
             if not target_language:
                 return self.DEFAULT_LANGUAGE
 
-            in_codes = target_language in whisper.tokenizer.LANGUAGES
-            in_names = target_language in whisper.tokenizer.LANGUAGES.values()
-
-            if in_codes or in_names:
-                return target_language
+            language_code = _language_code(target_language)
+            if language_code:
+                return language_code
             else:
                 print("Invalid language code or name. Please refer to the supported "
                       "languages list and try again.")
@@ -453,7 +753,7 @@ class YouTubeTranscriber:
                 " - Enter 'n' to skip\n"
                 "Choice (default n): "
             )
-            user_input = input(prompt).strip()
+            user_input = _read_input(prompt).strip()
             user_lower = user_input.lower()
 
             if not user_input or user_lower in AIEnhancementMode.DISABLED.value:
@@ -496,7 +796,8 @@ class YouTubeTranscriber:
             print("You can enter a custom prompt instead.")
             print("  E. Enter custom prompt")
             while True:
-                user_input = input("Select option (E to enter custom prompt, or press Enter to skip): ").strip()
+                user_input = _read_input(
+                    "Select option (E to enter custom prompt, or press Enter to skip): ").strip()
                 if not user_input:
                     return (None, None)
                 elif user_input.lower() == 'e':
@@ -510,7 +811,8 @@ class YouTubeTranscriber:
         print("  E. Enter custom prompt")
 
         while True:
-            user_input = input(f"Select prompt file (number, name, or E for custom; default 1. {prompts[0]}): ").strip()
+            user_input = _read_input("Select prompt file (number, name, or E for custom; "
+                                     f"default 1. {prompts[0]}): ").strip()
             if not user_input:
                 return (prompts[0], None)
             elif user_input.lower() == 'e':
@@ -533,7 +835,7 @@ class YouTubeTranscriber:
         print("Enter your custom prompt (press Enter twice to finish):")
         lines = []
         while True:
-            line = input()
+            line = _read_input()
             if line == '':
                 break
             lines.append(line)
@@ -590,7 +892,7 @@ class YouTubeTranscriber:
         Returns:
             list[str]: List of text chunks.
         """
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        sentences = _SENTENCE_SPLIT_RE.split(text)
 
         chunks = []
         current_chunk = ""
@@ -879,7 +1181,7 @@ class YouTubeTranscriber:
                     enhanced = generated[len(full_prompt):].strip()
 
             # Reasoning models (e.g., DeepSeek-R1 distills) emit <think> blocks; drop them
-            enhanced = re.sub(r'<think>.*?</think>', '', enhanced, flags=re.DOTALL).strip()
+            enhanced = _THINK_BLOCK_RE.sub('', enhanced).strip()
 
             if not enhanced or len(enhanced) < len(chunk) * 0.3:
                 return ""
@@ -931,72 +1233,149 @@ class YouTubeTranscriber:
 
 
     def startfile(self, fn):
-        """Open file with system default app (cross-platform)."""
-        if os.name == 'nt':
+        """Open file with system default app (cross-platform) without waiting on it."""
+        if sys.platform.startswith('win'):
             os.startfile(fn)
-        elif os.name == 'posix':
+        else:
             opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
-            subprocess.run([opener, fn], check=True)
+            # Fire and forget: xdg-open can block until the viewer exits
+            subprocess.Popen([opener, fn], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
     def sanitize_filename(self, text):
         """Strip invalid characters from filename; never returns an empty name."""
-        cleaned = "".join(c for c in text if c.isalnum() or c in "._- ").strip()
+        cleaned = text.translate(_FILENAME_CHARS).strip()
         return cleaned or "untitled"
 
     def create_and_open_txt(self, text, filename):
-        """Write transcript text to the Transcript/ directory and open it."""
+        """Write transcript text to the Transcript/ directory and open it.
+
+        Returns:
+            str or None: The written file's path, or None if it couldn't be saved.
+        """
         # cwd-relative like the Audio/Video dirs, so all outputs land together
         output_dir = self.TRANSCRIPT_DIR
 
         if not self.ensure_directory_exists(output_dir):
             print(f"Error: Cannot create transcript directory {output_dir}")
-            return False
+            return None
 
         file_path = os.path.join(output_dir, filename)
 
         if not self.verify_file_writable(file_path):
             print(f"Error: Cannot write to transcript file {file_path}")
-            return False
+            return None
 
-        required_space = max(len(text) * 2, 1024 * 1024)
-        free_space = self.get_free_disk_space(output_dir)
-        if free_space is not None and free_space < required_space:
-            print(f"Error: Not enough disk space to save transcript. Need {required_space/1024/1024:.1f}MB, have {free_space/1024/1024:.1f}MB free.")
-            return False
+        # Encode once (keeping text mode's platform line endings) and write the bytes in one go
+        data = text.replace("\n", os.linesep).encode('utf-8')
+
+        # Only worth a disk-space query when the transcript is big enough to matter
+        required_space = len(data)
+        if required_space >= 1024 * 1024:
+            free_space = self.get_free_disk_space(output_dir)
+            if free_space is not None and free_space < required_space:
+                print("Error: Not enough disk space to save transcript. "
+                      f"Need {required_space/1024/1024:.1f}MB, "
+                      f"have {free_space/1024/1024:.1f}MB free.")
+                return None
 
         try:
-            with open(file_path, "w", encoding='utf-8') as file:
-                file.write(text)
+            with open(file_path, "wb") as file:
+                file.write(data)
             self.startfile(file_path)
-            return True
+            return file_path
         except (PermissionError, OSError) as e:
             print(f"Error writing transcript file: {str(e)}")
-            return False
+            return None
 
+    def get_youtube_object(self, url):
+        """Return the cached YouTube object for url, building and caching it if needed.
+
+        Lets setup validate a URL and later list its resolutions without
+        constructing a second object; the pipeline then takes it over via
+        create_youtube_object. Raises whatever YouTube() raises.
+        """
+        self._join_metadata_prefetch(url)
+        yt = self._youtube_objects.get(url)
+        if yt is None:
+            yt = self._youtube_objects[url] = YouTube(url, "WEB")
+        return yt
 
     @retry(stop=stop_after_attempt(3), wait=wait_fixed(2),
            retry=retry_if_exception_type(Exception))
     def create_youtube_object(self, url):
         """Create YouTube object (retries up to 3 times on failures)."""
+        # Reuse the object built while validating the URL, if there was one
+        self._join_metadata_prefetch(url)
+        if url in self._youtube_objects:
+            return self._youtube_objects.pop(url)
         try:
             return YouTube(url, "WEB")
         except (RegexMatchError, VideoUnavailable, VideoPrivate, VideoRegionBlocked, ValueError, OSError) as e:
             print(f"Error creating YouTube object: {str(e)}")
             raise
 
+    def prefetch_metadata(self, yt):
+        """Fetch a YouTube object's watch page, player JS and player response.
+
+        pytubefix loads them lazily the first time yt.title /
+        check_availability() / yt.streams need them, and caches them on `yt`.
+        Each depends on the one before (the JS URL comes from the watch page,
+        the WEB player request needs the JS's signature timestamp), and the
+        lazy properties aren't locked, so they are loaded in order on one
+        thread. Errors are left for the real accesses to raise.
+        """
+        try:
+            for attribute in ("watch_html", "js", "vid_info"):
+                getattr(yt, attribute)
+        except Exception:
+            pass
+
+    def prefetch_metadata_async(self, url):
+        """Start prefetch_metadata for url's YouTube object on a background thread.
+
+        Called as soon as the source URL is known, so the network round trips
+        overlap the remaining setup prompts. get_youtube_object and
+        create_youtube_object wait for the thread before handing the object out.
+        Errors are left for those later accesses to report.
+        """
+        if url in self._metadata_threads:
+            return
+        try:
+            yt = self.get_youtube_object(url)
+        except Exception:
+            return
+        thread = threading.Thread(target=self.prefetch_metadata, args=(yt,), daemon=True)
+        self._metadata_threads[url] = thread
+        thread.start()
+
+    def _join_metadata_prefetch(self, url):
+        """Wait for a prefetch_metadata_async thread on url, if one was started."""
+        thread = self._metadata_threads.pop(url, None)
+        if thread is not None:
+            thread.join()
+
     @staticmethod
     def sort_streams_by_resolution(streams):
         """Sort video streams by resolution, highest first."""
         return sorted(
             streams,
-            key=lambda stream: int(stream.resolution[:-1]) if stream.resolution else 0,  # [:-1] strips 'p' from '1080p'
+            key=lambda stream: _RESOLUTION_HEIGHTS[stream.resolution],
             reverse=True
         )
 
     def get_sorted_video_streams(self, yt):
-        """Get available video streams sorted by resolution (highest first)."""
+        """Get available video streams sorted by resolution (highest first).
+
+        The list is cached on `yt`, so the FETCH picker during setup and the
+        pipeline's stream selection share one sort. It goes away with the
+        object, so a later session never reuses expired stream URLs. Callers
+        must not mutate it.
+        """
+        cached = getattr(yt, "_sorted_video_streams", None)
+        if cached is not None:
+            return cached
         try:
-            return self.sort_streams_by_resolution(yt.streams.filter(only_video=True))
+            streams = self.sort_streams_by_resolution(yt.streams.filter(only_video=True))
         except RegexMatchError as e:
             print(f"Error retrieving video streams: {str(e)}")
             print("YouTube may have changed something. Try: pip install --upgrade pytubefix")
@@ -1004,45 +1383,119 @@ class YouTubeTranscriber:
         except (AttributeError, ValueError, OSError) as e:
             print(f"Error retrieving video streams: {str(e)}")
             return []
+        if streams:
+            yt._sorted_video_streams = streams
+        return streams
+
+    @staticmethod
+    def _audio_bitrate(stream):
+        """Bitrate of an audio stream in kbps, 0 when unknown."""
+        return int(stream.abr[:-4]) if stream.abr else 0  # [:-4] strips 'kbps' from '128kbps'
 
-    def get_sorted_audio_streams(self, yt):
-        """Get available audio streams sorted by bitrate (highest first)."""
+    def get_best_audio_stream(self, yt):
+        """Get the highest-bitrate audio stream in one pass, or None if there is none."""
         try:
-            audio_streams = yt.streams.filter(only_audio=True)
-            return sorted(
-                audio_streams,
-                key=lambda stream: int(stream.abr[:-4]) if stream.abr else 0,  # [:-4] strips 'kbps' from '128kbps'
-                reverse=True
-            )
+            return max(yt.streams.filter(only_audio=True), key=self._audio_bitrate, default=None)
         except RegexMatchError as e:
             print(f"Error retrieving audio streams: {str(e)}")
             print("YouTube may have changed something. Try: pip install --upgrade pytubefix")
-            return []
+            return None
         except (AttributeError, ValueError) as e:
             print(f"Error retrieving audio streams: {str(e)}")
-            return []
+            return None
 
     def get_unique_sorted_resolutions(self, streams):
         """Extract unique resolutions from streams and sort by quality (highest first)."""
-        resolutions = set([stream.resolution for stream in streams if stream.resolution])
+        # One pass: keying on the parsed height dedupes and gives the sort key at once
+        by_height = {_RESOLUTION_HEIGHTS[stream.resolution]: stream.resolution
+                     for stream in streams if stream.resolution}
+        return [by_height[height] for height in sorted(by_height, reverse=True)]
 
-        return sorted(
-            resolutions,
-            key=lambda res: int(res[:-1]) if res else 0,  # Strip 'p' suffix for numeric sorting
-            reverse=True
-        )
+    def download_stream(self, stream, output_dir, filename):
+        """Download a pytubefix stream, fetching byte ranges over parallel connections.
+
+        YouTube throttles each connection, so several concurrent range requests
+        fill the link far better than pytubefix's single sequential one. Streams
+        no bigger than one chunk, or any failure on the ranged path, fall back
+        to stream.download().
+
+        Returns:
+            str: Path of the downloaded file.
+        """
+        file_path = os.path.join(output_dir, filename)
+        try:
+            total_size = stream.filesize
+        except (OSError, ValueError):
+            total_size = 0
+
+        if total_size > self.DOWNLOAD_CHUNK_SIZE:
+            try:
+                self._download_ranges(stream.url, file_path, total_size)
+                return file_path
+            except (OSError, ValueError) as e:
+                print(f"Warning: Parallel download failed ({str(e)}); "
+                      "retrying over a single connection...")
+                # The file was preallocated to the full size, which stream.download()'s
+                # skip_existing would take for a finished download
+                try:
+                    os.remove(file_path)
+                except OSError:
+                    pass
+
+        stream.download(output_path=output_dir, filename=filename)
+        return file_path
+
+    def _download_ranges(self, url, file_path, total_size):
+        """Fetch `url` into `file_path` as DOWNLOAD_CHUNK_SIZE byte ranges in parallel."""
+        chunk_size = self.DOWNLOAD_CHUNK_SIZE
+        ranges = [(start, min(start + chunk_size, total_size) - 1)
+                  for start in range(0, total_size, chunk_size)]
+        # Preallocate so every worker can write its range in place
+        with open(file_path, "wb") as f:
+            f.truncate(total_size)
+
+        # One keep-alive session per worker thread: later ranges reuse the
+        # connection instead of paying a fresh TCP + TLS handshake each
+        local = threading.local()
+        sessions = []
+
+        def fetch(byte_range):
+            start, end = byte_range
+            session = getattr(local, "session", None)
+            if session is None:
+                session = local.session = requests.Session()
+                sessions.append(session)
+            # googlevideo takes the range as a query parameter (as pytubefix does)
+            response = session.get(f"{url}&range={start}-{end}",
+                                   headers={"User-Agent": "Mozilla/5.0"},
+                                   stream=True, timeout=30)
+            response.raise_for_status()
+            received = 0
+            with open(file_path, "r+b") as f:
+                f.seek(start)
+                for block in response.iter_content(chunk_size=64 * 1024):
+                    f.write(block)
+                    received += len(block)
+            if received != end - start + 1:
+                raise ValueError(f"expected {end - start + 1} bytes for range {start}-{end}, "
+                                 f"got {received}")
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.DOWNLOAD_CONNECTIONS) as pool:
+                list(pool.map(fetch, ranges))
+        finally:
+            for session in sessions:
+                session.close()
 
     def download_audio_stream(self, yt, filename_base, is_temp=False):
         """Download highest quality audio stream (optionally to temp directory)."""
         print("Downloading the audio stream (highest quality)...")
 
-        audio_streams = self.get_sorted_audio_streams(yt)
+        audio_stream = self.get_best_audio_stream(yt)
 
-        if not audio_streams:
+        if audio_stream is None:
             raise ValueError("No audio streams available for this video")
 
-        audio_stream = audio_streams[0]
-
         audio_filename = filename_base + self.MP3_EXT
         output_dir = os.path.join(self.AUDIO_DIR, self.TEMP_DIR) if is_temp else self.AUDIO_DIR
         os.makedirs(output_dir, exist_ok=True)
@@ -1051,7 +1504,7 @@ class YouTubeTranscriber:
 
         @retry(stop=stop_after_attempt(3), wait=wait_fixed(2))
         def download_with_retry():
-            audio_stream.download(output_path=output_dir, filename=audio_filename)
+            self.download_stream(audio_stream, output_dir, audio_filename)
             if not os.path.exists(relative_path):
                 raise FileNotFoundError(f"Failed to download audio stream to {relative_path}")
             return True
@@ -1063,6 +1516,44 @@ class YouTubeTranscriber:
 
         return relative_path, absolute_path
 
+    def extract_audio_track(self, video_path, filename_base):
+        """Save a local video's audio track to AUDIO_DIR for transcription.
+
+        ffmpeg stream-copies the track, so nothing is decoded or re-encoded;
+        moviepy's MP3 re-encode is the fallback if the copy fails.
+
+        Returns:
+            str or None: Path of the extracted audio, or None on failure.
+        """
+        audio_file = os.path.join(self.AUDIO_DIR, filename_base + self.MKA_EXT)
+        command = ["ffmpeg", "-nostdin", "-hide_banner", "-nostats", "-loglevel", "error",
+                   "-y", "-i", video_path, "-vn", "-c:a", "copy", audio_file]
+        try:
+            subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                           check=True)
+            return audio_file
+        except (subprocess.CalledProcessError, OSError):
+            pass
+
+        audio_file = os.path.join(self.AUDIO_DIR, filename_base + self.MP3_EXT)
+        try:
+            try:
+                from moviepy import VideoFileClip  # moviepy 2.x
+            except ImportError:  # moviepy 1.x exposes it via the editor module
+                from moviepy.editor import VideoFileClip
+            video = VideoFileClip(video_path)
+            try:
+                if video.audio is None:
+                    print("Error: Video file has no audio track.")
+                    return None
+                video.audio.write_audiofile(audio_file)
+            finally:
+                video.close()
+        except (IOError, OSError, ValueError, AttributeError) as e:
+            print(f"Error processing video file: {str(e)}")
+            return None
+        return audio_file
+
     def combine_audio_video(self, video_path, audio_path, output_path, cleanup_temp=True, temp_video_dir=None):
         """Merge separate video and audio files using ffmpeg."""
         output_dir = os.path.dirname(output_path)
@@ -1079,10 +1570,14 @@ class YouTubeTranscriber:
             audio_size = os.path.getsize(audio_path)
             required_space = (video_size + audio_size) * 1.5
 
-            free_space = self.get_free_disk_space(output_dir)
-            if free_space is not None and free_space < required_space:
-                print(f"Error: Not enough disk space to combine video. Need {required_space/1024/1024:.1f}MB, have {free_space/1024/1024:.1f}MB free.")
-                return None
+            # Small outputs aren't worth the disk-space query
+            if required_space >= self.FREE_SPACE_CHECK_MIN:
+                free_space = self.get_free_disk_space(output_dir)
+                if free_space is not None and free_space < required_space:
+                    print("Error: Not enough disk space to combine video. "
+                          f"Need {required_space/1024/1024:.1f}MB, "
+                          f"have {free_space/1024/1024:.1f}MB free.")
+                    return None
         except (OSError, IOError) as e:
             print(f"Warning: Could not verify file sizes: {str(e)}")
 
@@ -1094,12 +1589,24 @@ class YouTubeTranscriber:
             print(f"Error: Audio file not found: {audio_path}")
             return None
 
-        command = f'ffmpeg -y -i "{video_path}" -i "{audio_path}" -c:v copy -c:a aac "{output_path}"'
+        # Remux both streams as-is; re-encode the audio to AAC only if MP4 can't hold its codec
+        # Errors only: no banner or progress stats for the pipe to buffer, and no
+        # stdin, which ffmpeg would otherwise read from the interactive terminal
+        inputs = ["ffmpeg", "-nostdin", "-hide_banner", "-nostats", "-loglevel", "error",
+                  "-y", "-i", video_path, "-i", audio_path]
+        copy_command = inputs + ["-c", "copy", "-movflags", "+faststart", output_path]
+        encode_command = inputs + ["-c:v", "copy", "-c:a", "aac", "-movflags", "+faststart",
+                                   output_path]
+        run_options = {"stdout": subprocess.DEVNULL, "stderr": subprocess.PIPE, "check": True}
 
         try:
-            subprocess.run(command, shell=True, capture_output=True, text=True, check=True)
+            try:
+                subprocess.run(copy_command, **run_options)
+            except subprocess.CalledProcessError:
+                subprocess.run(encode_command, **run_options)
         except subprocess.CalledProcessError as e:
-            print(f"Error combining audio and video: {e.stderr}")
+            error_tail = e.stderr[-2048:].decode("utf-8", errors="replace").strip()
+            print(f"Error combining audio and video: {error_tail}")
             return None
         except OSError:
             print("Error running ffmpeg")
@@ -1108,6 +1615,8 @@ class YouTubeTranscriber:
         if not os.path.exists(output_path):
             print("Error: Failed to create combined video file")
             return None
+        # The combined file just used up space the cached figures still count as free
+        self._free_space_cache.clear()
 
         if cleanup_temp:
             try:
@@ -1121,6 +1630,353 @@ class YouTubeTranscriber:
         print(f"Combined video saved to {output_path}")
         return output_path
 
+    def _select_device(self, backend):
+        """Pick the inference device for `backend`: 'cuda' if it can see a GPU, else 'cpu'.
+
+        faster-whisper asks CTranslate2, so that backend never imports PyTorch.
+        """
+        if backend == WhisperBackend.FASTER_WHISPER:
+            import ctranslate2
+            return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        try:
+            import torch
+        except ImportError:
+            return "cpu"
+        return "cuda" if torch.cuda.is_available() else "cpu"
+
+    def _has_tensor_cores(self):
+        """True if the current CUDA device is Volta (compute capability 7.0) or newer.
+
+        Older GPUs lack tensor cores, so half precision is slow or unsupported there.
+        """
+        import torch
+        return torch.cuda.get_device_capability()[0] >= 7
+
+    def _load_whisper_model(self, backend, model_name):
+        """Load `model_name` with the given WhisperBackend on the best available device.
+
+        The last MODEL_CACHE_SIZE models stay cached, so only the first
+        transcription with a given model pays the load cost. The lock is held
+        from the lookup to the insert, which makes a caller wait for an
+        in-flight background preload instead of loading twice.
+        """
+        device = self._select_device(backend)
+        key = (backend, model_name, device)
+        with self._model_lock:
+            model = self._model_cache.pop(key, None)
+            if model is not None:
+                # Re-inserting keeps the dict ordered least to most recently used
+                self._model_cache[key] = model
+                return model
+            # Evict first, so no more than MODEL_CACHE_SIZE models are resident while this one loads
+            self._evict_models(self.MODEL_CACHE_SIZE - 1)
+
+            if backend == WhisperBackend.FASTER_WHISPER:
+                from faster_whisper import WhisperModel
+                download_root = self._model_download_root(backend)
+                if device == "cuda":
+                    # int8 weights with fp16 activations want tensor cores; older GPUs run
+                    # plain int8.
+                    # CTranslate2 lists int8_float16 only where the GPU supports it.
+                    import ctranslate2
+                    cuda_types = ctranslate2.get_supported_compute_types("cuda")
+                    compute_type = "int8_float16" if "int8_float16" in cuda_types else "int8"
+                    model = WhisperModel(model_name, device="cuda", compute_type=compute_type,
+                                         download_root=download_root)
+                else:
+                    # CTranslate2 uses only 4 threads unless told otherwise
+                    model = WhisperModel(model_name, device="cpu", compute_type="int8",
+                                         cpu_threads=os.cpu_count() or 0,
+                                         download_root=download_root)
+            elif backend == WhisperBackend.TENSORRT:
+                from whisper_trt import load_trt_model
+                # Builds the engines on first use and caches them under ~/.cache/whisper_trt
+                model = load_trt_model(model_name)
+            elif backend == WhisperBackend.ONNX:
+                cache_dir = (self._model_download_root(backend)
+                             or os.path.join(os.path.expanduser("~"), ".cache", "whisper-onnx"))
+                model = self._load_onnx_pipeline(model_name, device, cache_dir)
+            else:
+                import whisper
+                # in_memory reads the checkpoint once instead of re-opening it per tensor
+                model = whisper.load_model(model_name, device=device, in_memory=True,
+                                           download_root=self._model_download_root(backend))
+                if device == "cpu":
+                    import torch
+                    torch.set_num_threads(os.cpu_count() or torch.get_num_threads())
+                    model = self._quantize_for_cpu(model)
+            self._model_cache[key] = model
+            return model
+
+    def _model_download_root(self, backend):
+        """Directory for `backend`'s downloaded weights, or None for the library's own cache.
+
+        Opt-in through WHISPER_MODEL_DIR (one subdirectory per backend), so
+        weights already in ~/.cache are used unless the user asks otherwise.
+        """
+        model_dir = os.getenv("WHISPER_MODEL_DIR")
+        return os.path.join(model_dir, backend.key) if model_dir else None
+
+    def _load_onnx_pipeline(self, model_name, device, cache_dir):
+        """Build a transformers ASR pipeline over an ONNX Runtime export of `model_name`.
+
+        The first use exports the Hugging Face checkpoint to ONNX under
+        `cache_dir`; later runs load the saved export directly.
+        """
+        from optimum.onnxruntime import ORTModelForSpeechSeq2Seq
+        from transformers import AutoProcessor, pipeline
+
+        # The original large checkpoint is published without the -v1 suffix
+        hub_name = "large" if model_name == ModelSize.LARGE_V1.value else model_name
+        export_dir = os.path.join(cache_dir, hub_name)
+        provider = "CUDAExecutionProvider" if device == "cuda" else "CPUExecutionProvider"
+        # IO binding keeps inputs, outputs and the KV cache on the GPU across decoder steps
+        options = {"provider": provider, "use_io_binding": device == "cuda"}
+
+        if os.path.isdir(export_dir):
+            ort_model = ORTModelForSpeechSeq2Seq.from_pretrained(export_dir, **options)
+            processor = AutoProcessor.from_pretrained(export_dir)
+        else:
+            print(f"Exporting {model_name} to ONNX (first use only)...")
+            hub_id = f"openai/whisper-{hub_name}"
+            ort_model = ORTModelForSpeechSeq2Seq.from_pretrained(hub_id, export=True, **options)
+            processor = AutoProcessor.from_pretrained(hub_id)
+            ort_model.save_pretrained(export_dir)
+            processor.save_pretrained(export_dir)
+
+        return pipeline("automatic-speech-recognition", model=ort_model,
+                        tokenizer=processor.tokenizer,
+                        feature_extractor=processor.feature_extractor, chunk_length_s=30,
+                        batch_size=self.WHISPER_BATCH_SIZE)
+
+    def _quantize_for_cpu(self, model):
+        """Dynamically quantize an openai-whisper model's linear layers to INT8.
+
+        CPU inference is bound by loading weights from memory, and the linear
+        projections hold most of them; INT8 weights are a quarter of the size.
+        Returns the original model if quantization isn't supported here.
+        """
+        import torch
+        import whisper
+        try:
+            # whisper.model.Linear only adds a dtype cast, but quantize_dynamic
+            # matches exact module types, so hand it plain nn.Linear layers
+            for module in model.modules():
+                if type(module) is whisper.model.Linear:
+                    module.__class__ = torch.nn.Linear
+            return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        except (RuntimeError, AssertionError) as e:
+            print(f"Warning: INT8 quantization unavailable ({str(e)}); "
+                  "using full-precision weights.")
+            return model
+
+    def clear_model_cache(self):
+        """Drop every cached Whisper model and hand freed GPU memory back to the driver."""
+        self._evict_models(0)
+
+    def _evict_models(self, keep):
+        """Drop least recently used models until at most `keep` remain, freeing their GPU memory."""
+        with self._model_lock:
+            if len(self._model_cache) <= keep:
+                return
+            while len(self._model_cache) > keep:
+                del self._model_cache[next(iter(self._model_cache))]
+            # Only if a backend already imported torch; never import it just for this
+            torch = sys.modules.get("torch")
+            if torch is not None and torch.cuda.is_available():
+                torch.cuda.empty_cache()
+
+    def preload_whisper_model(self, model_name, target_language):
+        """Start loading `model_name` on a background thread.
+
+        Lets the model load overlap with the stream downloads. Errors are left
+        for transcribe_audio_file to report when it loads the model itself.
+        """
+        backend, load_name = WhisperBackend.resolve(model_name, target_language)
+
+        def load():
+            try:
+                self._load_whisper_model(backend, load_name)
+            except Exception:
+                pass
+
+        threading.Thread(target=load, daemon=True).start()
+
+    def _batched_pipeline(self, model):
+        """Wrap a faster-whisper model for batched inference, if supported.
+
+        The batched pipeline splits the audio at VAD-detected pauses and decodes
+        the pieces as one batch, so the encoder runs a few large matrix
+        multiplies instead of one per 30-second window. Returns None with
+        faster-whisper releases that predate BatchedInferencePipeline (< 1.1).
+        """
+        try:
+            from faster_whisper import BatchedInferencePipeline
+        except ImportError:
+            return None
+        return BatchedInferencePipeline(model=model)
+
+    def _decode_audio(self, backend, file_path):
+        """Decode `file_path` once into the 16 kHz mono float32 array Whisper consumes.
+
+        Every backend accepts the array directly, so the downloaded stream is
+        decoded and resampled once with nothing written to disk. faster-whisper
+        uses its own PyAV decoder, keeping openai-whisper and PyTorch unloaded.
+        """
+        if backend == WhisperBackend.FASTER_WHISPER:
+            from faster_whisper import decode_audio
+            return decode_audio(file_path)
+        import whisper
+        return whisper.audio.load_audio(file_path, sr=whisper.audio.SAMPLE_RATE)
+
+    def _run_whisper_model(self, backend, model, audio, target_language):
+        """Run a loaded model over a decoded `audio` array.
+
+        Returns:
+            tuple: (transcribed_text, language) with the language code Whisper reports.
+        """
+        if backend == WhisperBackend.FASTER_WHISPER:
+            # Greedy decoding matches openai-whisper's default; VAD skips silent stretches
+            options = {"language": target_language, "beam_size": 1, "vad_filter": True}
+            batched = self._batched_pipeline(model)
+            if batched is not None:
+                # Smaller batches on CPU, where each one is already compute-bound
+                batch_size = (self.WHISPER_BATCH_SIZE if self._select_device(backend) == "cuda"
+                              else self.WHISPER_CPU_BATCH_SIZE)
+                segments, info = batched.transcribe(audio, batch_size=batch_size, **options)
+            else:
+                segments, info = model.transcribe(audio, **options)
+            # Segments are decoded lazily, so show each one as soon as it's ready
+            print("\nTranscription:")
+            texts = []
+            for segment in segments:
+                print(segment.text, end="", flush=True)
+                texts.append(segment.text)
+            print("\n")
+            return "".join(texts), info.language
+        if backend == WhisperBackend.ONNX:
+            import whisper
+            generate_kwargs = {}
+            if getattr(model.model.generation_config, "is_multilingual", False):
+                generate_kwargs = {"language": target_language, "task": "transcribe"}
+            result = model({"raw": audio, "sampling_rate": whisper.audio.SAMPLE_RATE},
+                           generate_kwargs=generate_kwargs)
+            return result["text"], target_language
+        if backend == WhisperBackend.TENSORRT:
+            # whisper_trt decodes English only and reports no language
+            return model.transcribe(audio)["text"], "en"
+        import whisper
+        fp16 = False
+        if model.device.type == "cuda":
+            import torch
+            fp16 = self._has_tensor_cores()
+            # Handing transcribe() a GPU tensor makes it compute the log-mel features there as well
+            audio = torch.from_numpy(audio).to(model.device)
+            if len(audio) > whisper.audio.N_SAMPLES:
+                return self._decode_windows(model, audio, target_language, fp16)
+        result = model.transcribe(audio, language=target_language, fp16=fp16)
+        return result["text"], result.get("language", target_language)
+
+    def _decode_windows(self, model, audio, target_language, fp16):
+        """Transcribe long GPU-resident audio as batches of overlapping 30-second windows.
+
+        transcribe() decodes one window at a time, which leaves most of the GPU
+        idle; decoding WHISPER_BATCH_SIZE windows per whisper.decode call keeps
+        it busy. Each batch is encoded once, and windows that come out
+        repetitive or low-confidence are re-decoded from those features at
+        higher temperatures, with silent ones dropped, as transcribe() does.
+        The overlap between windows is removed by matching words where
+        neighbouring windows meet.
+
+        Returns:
+            tuple: (transcribed_text, language). Like transcribe(), the language
+            is target_language when one is given; otherwise the language
+            whisper.decode detected in the most windows.
+        """
+        import torch
+        import whisper
+        window = whisper.audio.N_SAMPLES
+        overlap = self.WINDOW_OVERLAP_SECONDS * whisper.audio.SAMPLE_RATE
+        starts = range(0, max(len(audio) - overlap, 1), window - overlap)
+
+        options = whisper.DecodingOptions(language=target_language, temperature=0.0,
+                                          fp16=fp16, without_timestamps=True)
+        window_texts = []
+        languages = collections.Counter()
+        for batch_index in range(0, len(starts), self.WHISPER_BATCH_SIZE):
+            batch_starts = starts[batch_index:batch_index + self.WHISPER_BATCH_SIZE]
+            mel = torch.stack([
+                whisper.log_mel_spectrogram(whisper.pad_or_trim(audio[start:start + window]),
+                                            model.dims.n_mels)
+                for start in batch_starts
+            ])
+            features = model.embed_audio(mel.half() if fp16 else mel)
+            for window_features, result in zip(features, whisper.decode(model, features, options)):
+                result = self._decode_window_with_fallback(model, window_features, options, result)
+                # The forced language when there is one; decode only detects without it
+                languages[result.language] += 1
+                silent = (result.no_speech_prob > self.NO_SPEECH_THRESHOLD
+                          and result.avg_logprob < self.LOGPROB_THRESHOLD)
+                window_texts.append("" if silent else result.text)
+
+        words = []
+        for text in window_texts:
+            current = text.split()
+            drop_previous, drop_current = self._window_overlap(words, current)
+            if drop_previous:
+                del words[-drop_previous:]
+            words.extend(current[drop_current:])
+        language = target_language or languages.most_common(1)[0][0]
+        return " ".join(words), language
+
+    def _needs_fallback(self, result):
+        """Whether a window decode looks like a repetition loop or a low-confidence guess."""
+        if (result.no_speech_prob > self.NO_SPEECH_THRESHOLD
+                and result.avg_logprob < self.LOGPROB_THRESHOLD):
+            # Silence; it is dropped rather than retried
+            return False
+        return (result.compression_ratio > self.COMPRESSION_RATIO_THRESHOLD
+                or result.avg_logprob < self.LOGPROB_THRESHOLD)
+
+    def _decode_window_with_fallback(self, model, features, options, result):
+        """Re-decode one window at rising temperatures until it passes _needs_fallback."""
+        import whisper
+        for temperature in self.WINDOW_FALLBACK_TEMPERATURES:
+            if not self._needs_fallback(result):
+                break
+            # Sampled retries take the best of 5 candidates, as transcribe() does
+            result = whisper.decode(model, features,
+                                    replace(options, temperature=temperature, best_of=5))
+        return result
+
+    @staticmethod
+    def _window_overlap(previous, current, max_words=10):
+        """Words to drop where `previous` ends and `current` begins the same speech.
+
+        Words are compared ignoring case and punctuation, which Whisper often
+        changes at a window edge. A word cut in half by the edge decodes
+        differently in each window, so one trailing word of `previous` and one
+        leading word of `current` may be skipped, but only for matches of two
+        or more words.
+
+        Returns:
+            tuple: (words to drop from the end of previous, words to drop from
+            the start of current); (0, 0) when no overlap is found.
+        """
+        tail = [_WORD_PUNCT_RE.sub("", word.lower()) for word in previous[-(max_words + 1):]]
+        head = [_WORD_PUNCT_RE.sub("", word.lower()) for word in current[:max_words + 1]]
+        for length in range(min(max_words, len(tail), len(head)), 0, -1):
+            for skip_previous in (0, 1):
+                for skip_current in (0, 1):
+                    if (skip_previous or skip_current) and length < 2:
+                        continue
+                    end = len(tail) - skip_previous
+                    if end < length or skip_current + length > len(head):
+                        continue
+                    if tail[end - length:end] == head[skip_current:skip_current + length]:
+                        return skip_previous, skip_current + length
+        return 0, 0
+
     def transcribe_audio_file(self, file_path, model_name, target_language):
         """Transcribe audio file using Whisper and detect the language."""
         if not os.path.exists(file_path):
@@ -1128,27 +1984,37 @@ class YouTubeTranscriber:
             print(error_msg)
             return error_msg, "en"
 
+        backend, load_name = WhisperBackend.resolve(model_name, target_language)
         try:
-            print(f"Loading Whisper model: {model_name}")
-            model = whisper.load_model(model_name)
-        except (OSError, ValueError) as load_error:
+            # Show the device so a GPU host silently falling back to CPU is easy to spot
+            print(f"Loading Whisper model: {load_name} "
+                  f"({backend.key} on {self._select_device(backend)})")
+            model = self._load_whisper_model(backend, load_name)
+        except (OSError, ValueError, RuntimeError) as load_error:
             print(f"Error loading Whisper model: {str(load_error)}")
-            print("Falling back to base model")
+            if backend != WhisperBackend.WHISPER:
+                # openai-whisper is always installed and runs every model
+                print(f"Falling back to the {WhisperBackend.WHISPER.key} backend")
+                backend, load_name = WhisperBackend.WHISPER, model_name
+            else:
+                print("Falling back to base model")
+                load_name = "base"
             try:
-                model = whisper.load_model("base")
-            except (OSError, ValueError) as fallback_error:
+                model = self._load_whisper_model(backend, load_name)
+            except (OSError, ValueError, RuntimeError) as fallback_error:
                 print(f"Error loading fallback model: {str(fallback_error)}")
                 return "Error: Unable to load Whisper model", "en"
 
-        target_language_full = whisper.tokenizer.LANGUAGES.get(target_language, target_language)
-        target_language_full = target_language_full.capitalize()
+        target_language_full = _LANGUAGE_DISPLAY_NAMES.get(target_language,
+                                                           target_language.capitalize())
 
         absolute_path = os.path.abspath(file_path)
         print(f"Transcribing audio from {absolute_path} into {target_language_full}...")
 
         try:
-            result = model.transcribe(file_path, language=target_language)
-            transcribed_text = result["text"]
+            audio = self._decode_audio(backend, file_path)
+            transcribed_text, detected_language = self._run_whisper_model(
+                backend, model, audio, target_language)
 
             if not transcribed_text.strip():
                 print("Warning: Transcription produced empty text. The audio might be silent or not contain speech.")
@@ -1159,20 +2025,18 @@ class YouTubeTranscriber:
             print(error_msg)
             return error_msg, "en"
 
-        print("\nTranscription:\n" + transcribed_text + "\n")
+        if backend != WhisperBackend.FASTER_WHISPER:
+            # faster-whisper already printed its segments as they were decoded
+            print("\nTranscription:\n" + transcribed_text + "\n")
 
-        try:
-            detected_language = detect(transcribed_text)
-            detected_language_full = whisper.tokenizer.LANGUAGES.get(detected_language, detected_language)
-            detected_language_full = detected_language_full.capitalize()
+        # Whisper reports the language it decoded in; no second pass over the text is needed
+        detected_language_full = _LANGUAGE_DISPLAY_NAMES.get(detected_language,
+                                                             detected_language.capitalize())
 
-            if detected_language_full == target_language_full:
-                print(f"Verified {detected_language_full}")
-            else:
-                print("Transcription/translation mismatch")
-        except LangDetectException as e:
-            print(f"Error detecting language: {str(e)}")
-            detected_language = "unknown"
+        if detected_language_full == target_language_full:
+            print(f"Verified {detected_language_full}")
+        else:
+            print("Transcription/translation mismatch")
 
         return transcribed_text, detected_language
 
@@ -1189,6 +2053,9 @@ class YouTubeTranscriber:
 
         return True
 
+    def profile_path(self, filename):
+        """Path of a file (a profile or config.txt) directly inside PROFILE_DIR."""
+        return self._PROFILE_DIR_PREFIX + filename
 
     def list_profiles(self):
         """List profile files in the Profile/ directory, sorted by name.
@@ -1196,10 +2063,13 @@ class YouTubeTranscriber:
         Accepts: profile.txt, profile<number>.txt, profile-<desc>.txt,
         profile<number>-<desc>.txt
         """
-        if not os.path.exists(self.PROFILE_DIR):
+        try:
+            # scandir's entries carry the file type, so is_file() needs no extra stat
+            with os.scandir(self.PROFILE_DIR) as entries:
+                return sorted(entry.name for entry in entries
+                              if self.PROFILE_RE.match(entry.name) and entry.is_file())
+        except FileNotFoundError:
             return []
-        pattern = rf"^{re.escape(self.PROFILE_PREFIX)}(?:\d+)?(?:-.*)?{re.escape(self.ENV_EXT)}$"
-        return sorted(f for f in os.listdir(self.PROFILE_DIR) if re.match(pattern, f))
 
     def create_profile(self, profile_fields):
         """Save current session settings as a reusable profile file."""
@@ -1207,7 +2077,7 @@ class YouTubeTranscriber:
             print(f"Creating profile directory: {self.PROFILE_DIR}")
             os.makedirs(self.PROFILE_DIR, exist_ok=True)
 
-        config_path = os.path.join(self.PROFILE_DIR, self.CONFIG_ENV)
+        config_path = self.profile_path(self.CONFIG_ENV)
         if not os.path.exists(config_path):
             with open(config_path, "w", encoding='utf-8') as config_file:
                 config_file.write("# Configuration file for YouTube Transcriber\n")
@@ -1217,18 +2087,22 @@ class YouTubeTranscriber:
             print(f"{self.CONFIG_ENV} already exists: {os.path.abspath(config_path)}. "
                   "No changes were made to it.")
 
-        existing_profiles = self.list_profiles()
-        num_pattern = rf"^{re.escape(self.PROFILE_PREFIX)}(?P<num>\d+)(?:-.*)?{re.escape(self.ENV_EXT)}$"
-        existing_numbers = []
-        for f in existing_profiles:
-            m = re.match(num_pattern, f)
-            if m:
-                try:
-                    existing_numbers.append(int(m.group('num')))
-                except (ValueError, TypeError):
+        # One scan: numbered profiles match PROFILE_NUMBER_RE, the rest only PROFILE_RE
+        existing_numbers = set()
+        has_profiles = False
+        with os.scandir(self.PROFILE_DIR) as entries:
+            for entry in entries:
+                # A directory named like a profile isn't one
+                if not entry.is_file():
                     continue
-
-        if not existing_profiles:
+                m = self.PROFILE_NUMBER_RE.match(entry.name)
+                if m:
+                    existing_numbers.add(int(m.group('num')))
+                    has_profiles = True
+                elif self.PROFILE_RE.match(entry.name):
+                    has_profiles = True
+
+        if not has_profiles:
             profile_name = self.DEFAULT_PROFILE
         else:
             next_number = 0
@@ -1236,7 +2110,7 @@ class YouTubeTranscriber:
                 next_number += 1
             profile_name = self.PROFILE_NAME_TEMPLATE.format(next_number)
 
-        profile_path = os.path.join(self.PROFILE_DIR, profile_name)
+        profile_path = self.profile_path(profile_name)
 
         # DEFAULT_FIELDS declaration order defines the field order in the file
         field_order = list(self.DEFAULT_FIELDS)
@@ -1270,7 +2144,14 @@ class YouTubeTranscriber:
             return False
 
     def get_free_disk_space(self, directory):
-        """Get available disk space in bytes for the given directory."""
+        """Get available disk space in bytes for the given directory.
+
+        Results are reused for FREE_SPACE_TTL seconds, so back-to-back writes
+        (and "Run again?" repeats) share one statvfs call.
+        """
+        cached = self._free_space_cache.get(directory)
+        if cached is not None and time.monotonic() - cached[0] < self.FREE_SPACE_TTL:
+            return cached[1]
         try:
             if os.path.exists(directory):
                 target_dir = directory
@@ -1282,7 +2163,9 @@ class YouTubeTranscriber:
             if not os.path.exists(target_dir):
                 target_dir = '.'
 
-            return shutil.disk_usage(target_dir).free
+            free_space = shutil.disk_usage(target_dir).free
+            self._free_space_cache[directory] = (time.monotonic(), free_space)
+            return free_space
         except (OSError, IOError, ValueError) as e:
             print(f"Error checking disk space: {str(e)}")
             return None
@@ -1313,55 +2196,60 @@ class SessionConfig:
     used_fields: dict = field(default_factory=dict)
 
 
-# Session-scoped environment keys used to carry state across "Run again?" repeats
-_SESSION_ENV_KEYS = (
-    "_REPEAT_INVOCATION", "_REPEAT_PROFILE_NAME", "_REPEAT_ASK_COUNT",
-    "LAST_DOWNLOAD_VIDEO", "LAST_NO_AUDIO_IN_VIDEO", "LAST_RESOLUTION",
-    "LAST_DOWNLOAD_AUDIO", "LAST_TRANSCRIBE_AUDIO", "LAST_MODEL_CHOICE",
-    "LAST_TARGET_LANGUAGE", "LAST_USE_EN_MODEL", "LAST_AI_ENHANCEMENT"
-)
-
-
-def _clear_session_env():
-    """Remove all repeat-session environment variables."""
-    for key in _SESSION_ENV_KEYS:
-        os.environ.pop(key, None)
-
-
-def _bool_from_last(env_key, prompt_fn):
-    """Reuse a yes/no answer remembered from the previous repeat run, else prompt."""
-    last = os.environ.get(env_key)
+@dataclass
+class RepeatState:
+    """State main() carries from one session to the next across "Run again?" repeats."""
+    active: bool = False       # the current session is a repeat
+    profile_name: str = None   # profile a profile-driven session repeats with
+    ask_count: int = 0         # times "Run again?" has been asked
+    # Field name (e.g. "DOWNLOAD_VIDEO") -> previous interactive answer
+    last: dict = field(default_factory=dict)
+    # Previous session's settings, reused as a whole by _configure_repeat
+    previous: "SessionConfig" = None
+
+
+def _bool_from_last(repeat_state, field_name, prompt_fn, used_fields):
+    """Reuse a yes/no answer remembered from the previous repeat run, else prompt.
+
+    The answer is also recorded in `used_fields` under `field_name` for a
+    saved profile.
+    """
+    last = repeat_state.last.get(field_name)
     if last is not None:
-        print(f"Using previous {env_key[len('LAST_'):]}: {last} (from last session)")
-        return last.lower() in YesNo.YES.value
-    return prompt_fn()
+        print(f"Using previous {field_name}: {last} (from last session)")
+        answer = last.lower() in YesNo.YES.value
+    else:
+        answer = prompt_fn()
+    used_fields[field_name] = "y" if answer else "n"
+    return answer
 
 
-def _value_from_last(env_key, prompt_fn):
+def _value_from_last(repeat_state, field_name, prompt_fn):
     """Reuse a string answer remembered from the previous repeat run, else prompt."""
-    last = os.environ.get(env_key)
+    last = repeat_state.last.get(field_name)
     if last is not None:
-        print(f"Using previous {env_key[len('LAST_'):]}: {last} (from last session)")
+        print(f"Using previous {field_name}: {last} (from last session)")
         return last
     return prompt_fn()
 
 
-def _bool_from_profile_env(transcriber, var_name, profile_name, prompt_text,
+def _bool_from_profile_env(transcriber, profile_env, var_name, profile_name, prompt_text,
                            default='n', prompt_if_missing=True, missing=False):
-    """Read a yes/no profile field, falling back to an interactive prompt.
+    """Read a yes/no field from `profile_env`, falling back to an interactive prompt.
 
     Invalid values always fall back to the prompt; missing values fall back to
     the prompt only when prompt_if_missing is True (else return `missing`).
     """
-    value = os.getenv(var_name)
+    value = profile_env.get(var_name)
     if not value:
         if prompt_if_missing:
             return transcriber.get_yes_no_input(prompt_text, default=default)
         return missing
-    if value.lower() in YesNo.YES.value:
+    lower = value.lower()
+    if lower in YesNo.YES.value:
         print(f"Loaded {var_name}: {value} (from {profile_name})")
         return True
-    if value.lower() in YesNo.NO.value:
+    if lower in YesNo.NO.value:
         print(f"Loaded {var_name}: {value} (from {profile_name})")
         return False
     print(f"Invalid value for {var_name} in .env: {value}")
@@ -1406,7 +2294,7 @@ def _resolve_api_key(provider):
     """Get the API key for `provider` from the environment or prompt for it."""
     api_key = os.getenv(provider.api_key_env)
     if not api_key:
-        api_key = input(f"Enter your {provider.key} API key: ").strip()
+        api_key = _read_input(f"Enter your {provider.key} API key: ").strip()
     if not api_key:
         print("No API key provided. Disabling AI enhancement.")
         return None
@@ -1423,31 +2311,36 @@ def _prompt_profile_selection(transcriber, profiles):
     for i, profile in enumerate(profiles):
         print(f"{i+1}. {profile}")
 
+    # Every accepted answer -> profile: name without and with the extension,
+    # then menu numbers (which win, as the number check used to come first),
+    # and blank for the default
+    ext_len = len(transcriber.ENV_EXT)
+    choices = {profile[:-ext_len]: profile for profile in profiles}
+    choices.update({profile: profile for profile in profiles})
+    choices.update({str(i): profile for i, profile in enumerate(profiles, 1)})
+    choices[''] = profiles[0]
+
     while True:
-        profile_input = input(
+        profile_input = _read_input(
             f"Select a profile (number or name, default 1. {profiles[0]}, "
             f"or 'no' / 'n' / 'false' / 'f' / '0' / 'skip' / 's' to skip): "
         ).strip()
-        lower_input = profile_input.lower()
-        if profile_input == '' or lower_input == '1':
-            return profiles[0]
-        if profile_input.isdigit() and 1 <= int(profile_input) <= len(profiles):
-            return profiles[int(profile_input) - 1]
-        if profile_input in profiles:
-            return profile_input
-        if profile_input + transcriber.ENV_EXT in profiles:
-            return profile_input + transcriber.ENV_EXT
-        if lower_input in YesNo.all_no_and_skip():
+        choice = choices.get(profile_input)
+        if choice is not None:
+            return choice
+        if profile_input.lower() in _NO_OR_SKIP:
             return None
         print("Invalid profile selection.")
 
 
-def _prompt_resolution_selection(transcriber, yt):
+def _prompt_resolution_selection(transcriber, yt, available_streams=None):
     """List a video's available resolutions and let the user pick one.
 
+    `available_streams` may pass in the already-sorted video streams of `yt`.
     Exits the program if the video has no video streams.
     """
-    available_streams = transcriber.get_sorted_video_streams(yt)
+    if available_streams is None:
+        available_streams = transcriber.get_sorted_video_streams(yt)
     available_resolutions = transcriber.get_unique_sorted_resolutions(available_streams)
 
     if not available_resolutions:
@@ -1458,21 +2351,32 @@ def _prompt_resolution_selection(transcriber, yt):
     for i, res in enumerate(available_resolutions):
         print(f"{i+1}. {res}")
 
+    # Every accepted answer -> resolution: '720p', bare '720', then menu numbers,
+    # which take precedence over a bare height as they did in the old checks
+    choices = {res: res for res in available_resolutions}
+    choices.update({res[:-1]: res for res in available_resolutions})
+    choices.update({str(i): res for i, res in enumerate(available_resolutions, 1)})
+
     while True:
-        user_input = input("Enter desired resolution (number or resolution, default highest): ").lower()
+        user_input = _read_input(
+            "Enter desired resolution (number or resolution, default highest): ").lower()
         if not user_input:
             return available_resolutions[0]
-        if user_input.isdigit() and 1 <= int(user_input) <= len(available_resolutions):
-            return available_resolutions[int(user_input) - 1]
-        if user_input in available_resolutions or (user_input.isdigit() and user_input + "p" in available_resolutions):
-            return user_input if user_input in available_resolutions else user_input + "p"
+        choice = choices.get(user_input)
+        if choice is not None:
+            return choice
         print("Invalid input. Please enter a valid number or resolution.")
 
 
+def _first_stream_at(streams, resolution):
+    """First stream in `streams` with the given resolution (e.g. '720p'), or None."""
+    return next((stream for stream in streams if stream.resolution == resolution), None)
+
+
 def _prompt_resolution_input(transcriber, used_fields):
     """Prompt for a desired resolution (name, number, or fetch keyword)."""
     while True:
-        resolution = input(
+        resolution = _read_input(
             "... enter desired resolution (e.g., 720p, 720, highest, lowest, "
             "default get the highest resolutions), or enter fetch or f to get "
             "a list of available resolutions: "
@@ -1483,17 +2387,16 @@ def _prompt_resolution_input(transcriber, used_fields):
 
         resolution = resolution.lower()
 
-        if resolution in Resolution.values():
+        if resolution in _RESOLUTION_VALUES:
             if resolution == Resolution.F.value:
                 resolution = Resolution.FETCH.value
             used_fields["RESOLUTION"] = resolution
             return resolution
-        if resolution.endswith("p") and resolution[:-1].isdigit() and int(resolution[:-1]) > 0:
-            used_fields["RESOLUTION"] = resolution
-            return resolution
-        if resolution.isdigit():
-            if int(resolution) > 0:
-                resolution += "p"
+        match = _RESOLUTION_RE.fullmatch(resolution)
+        if match:
+            height = int(match.group(1))
+            if height > 0:
+                resolution = f"{height}p"
                 used_fields["RESOLUTION"] = resolution
                 return resolution
             print("Invalid resolution. Please enter a non-zero number.")
@@ -1502,7 +2405,17 @@ def _prompt_resolution_input(transcriber, used_fields):
                   "(e.g., 720p, 720, highest, lowest).")
 
 
-def _select_profile(transcriber):
+# profile path -> mtime when _load_profile_env last applied it to os.environ
+_loaded_profile_mtimes = {}
+
+
+def _load_profile_env(profile_path):
+    """Apply a profile file to os.environ, noting its mtime for repeat runs."""
+    load_dotenv(dotenv_path=profile_path, override=True)
+    _loaded_profile_mtimes[profile_path] = os.path.getmtime(profile_path)
+
+
+def _select_profile(transcriber, repeat_state):
     """Determine whether to run from a profile and load it if so.
 
     Handles repeat invocations, config.txt discovery, and interactive
@@ -1511,22 +2424,31 @@ def _select_profile(transcriber):
     Returns:
         tuple: (load_profile, profile_name)
     """
-    repeat_invocation = os.environ.get("_REPEAT_INVOCATION", "") == "1"
-    repeat_profile_name = os.environ.get("_REPEAT_PROFILE_NAME")
+    repeat_profile_name = repeat_state.profile_name
 
     # Repeat of a profile-driven session: reload the same profile
-    if repeat_invocation and repeat_profile_name:
-        profile_path = os.path.join(transcriber.PROFILE_DIR, repeat_profile_name)
-        if os.path.exists(profile_path):
-            load_dotenv(dotenv_path=profile_path, override=True)
+    if repeat_state.active and repeat_profile_name:
+        profile_path = transcriber.profile_path(repeat_profile_name)
+        try:
+            mtime = os.path.getmtime(profile_path)
+        except OSError:
+            print(f"Profile not found for repeat: {repeat_profile_name}. "
+                  "Falling back to selection.")
+            repeat_state.previous = None
+        else:
+            # Repeats run in this process, so an unchanged profile's values
+            # are still in os.environ and need no re-parse
+            if _loaded_profile_mtimes.get(profile_path) != mtime:
+                _load_profile_env(profile_path)
+                # Edited since the last session: re-read its settings too
+                repeat_state.previous = None
             print(f"Loaded profile (repeat): {repeat_profile_name}")
             return True, repeat_profile_name
-        print(f"Profile not found for repeat: {repeat_profile_name}. Falling back to selection.")
-    # Repeat of an interactive session: stay interactive (LAST_* answers apply)
-    elif repeat_invocation:
+    # Repeat of an interactive session: stay interactive (previous answers apply)
+    elif repeat_state.active:
         return False, None
 
-    config_env_path = os.path.join(transcriber.PROFILE_DIR, transcriber.CONFIG_ENV)
+    config_env_path = transcriber.profile_path(transcriber.CONFIG_ENV)
 
     if not os.path.exists(config_env_path):
         print(f"config.txt not found in the {transcriber.PROFILE_DIR} directory.")
@@ -1545,43 +2467,36 @@ def _select_profile(transcriber):
             print("Switching to default/interactive mode.")
             return False, None
 
-        load_dotenv(dotenv_path=os.path.join(transcriber.PROFILE_DIR, profile_name), override=True)
+        _load_profile_env(transcriber.profile_path(profile_name))
         print(f"Loaded profile: {profile_name}")
         return True, profile_name
 
     print(f"config.txt detected in the {transcriber.PROFILE_DIR} directory.")
-    load_dotenv(dotenv_path=config_env_path, override=True)
-    # Manually read LOAD_PROFILE from config.txt to ensure accurate value
-    # (utf-8-sig tolerates a BOM, which editors on Windows often add)
-    load_profile_str = None
-    with open(config_env_path, 'r', encoding='utf-8-sig') as cf:
-        for line in cf:
-            if line.strip().startswith("LOAD_PROFILE"):
-                _, sep, val = line.partition("=")
-                if not sep:
-                    continue  # malformed line (no '='); keep looking
-                load_profile_str = val.strip()
-                os.environ["LOAD_PROFILE"] = load_profile_str
-                break
+    # One parse serves both the environment and the LOAD_PROFILE lookup, as
+    # load_dotenv(override=True) would apply it (utf-8-sig tolerates a BOM,
+    # which editors on Windows often add)
+    config_values = dotenv_values(config_env_path, encoding='utf-8-sig')
+    os.environ.update({key: value for key, value in config_values.items() if value is not None})
+    load_profile_str = config_values.get("LOAD_PROFILE")
 
     print(f"LOAD_PROFILE: {load_profile_str} (from config.txt)")
     lower_lp = load_profile_str.lower() if load_profile_str else ''
 
     # Explicit profile names (not simple yes/no) take precedence
-    if load_profile_str and lower_lp not in YesNo.YES.value + YesNo.NO.value + YesNo.SKIP.value + ('',):
+    if load_profile_str and lower_lp not in _ANY_ANSWER:
         if not load_profile_str.endswith(transcriber.ENV_EXT):
             load_profile_str += transcriber.ENV_EXT
         profile_path = os.path.join(transcriber.PROFILE_DIR, load_profile_str)
         if os.path.exists(profile_path):
             profile_name = os.path.basename(profile_path)
             print(f"Loading profile: {profile_name}")
-            load_dotenv(dotenv_path=profile_path, override=True)
+            _load_profile_env(profile_path)
             print(f"Loaded profile: {profile_name}")
             return True, profile_name
         print(f"Profile not found: {load_profile_str}. Using interactive mode.")
         return False, None
 
-    if lower_lp in YesNo.NO.value + YesNo.SKIP.value:
+    if lower_lp in _NO_OR_SKIP:
         print("Using default/interactive mode.")
         return False, None
 
@@ -1595,16 +2510,16 @@ def _select_profile(transcriber):
     if profile_name is None:
         return False, None
 
-    load_dotenv(dotenv_path=os.path.join(transcriber.PROFILE_DIR, profile_name), override=True)
+    _load_profile_env(transcriber.profile_path(profile_name))
     print(f"Loaded profile: {profile_name}")
     return True, profile_name
 
 
-def _configure_interactive(transcriber):
+def _configure_interactive(transcriber, repeat_state):
     """Gather all session settings by prompting the user.
 
-    Answers remembered from a previous "Run again?" repeat (LAST_* environment
-    variables) are reused instead of re-prompting.
+    Answers remembered from a previous "Run again?" repeat (repeat_state.last)
+    are reused instead of re-prompting.
     """
     cfg = SessionConfig(used_fields=transcriber.DEFAULT_FIELDS.copy())
     used_fields = cfg.used_fields
@@ -1612,19 +2527,21 @@ def _configure_interactive(transcriber):
     cfg.url, cfg.is_local_file = transcriber.prompt_for_source()
 
     if not cfg.is_local_file:
+        transcriber.prefetch_metadata_async(cfg.url)
         cfg.download_video = _bool_from_last(
-            "LAST_DOWNLOAD_VIDEO",
-            lambda: transcriber.get_yes_no_input("Download video? (y/N): ", default='n'))
-        used_fields["DOWNLOAD_VIDEO"] = "y" if cfg.download_video else "n"
+            repeat_state, "DOWNLOAD_VIDEO",
+            lambda: transcriber.get_yes_no_input("Download video? (y/N): ", default='n'),
+            used_fields)
 
         if cfg.download_video:
             cfg.no_audio_in_video = _bool_from_last(
-                "LAST_NO_AUDIO_IN_VIDEO",
-                lambda: transcriber.get_yes_no_input("... without the audio in the video? (y/N): ", "n"))
-            used_fields["NO_AUDIO_IN_VIDEO"] = "y" if cfg.no_audio_in_video else "n"
+                repeat_state, "NO_AUDIO_IN_VIDEO",
+                lambda: transcriber.get_yes_no_input(
+                    "... without the audio in the video? (y/N): ", "n"),
+                used_fields)
 
             cfg.resolution = _value_from_last(
-                "LAST_RESOLUTION",
+                repeat_state, "RESOLUTION",
                 lambda: _prompt_resolution_input(transcriber, used_fields))
             if cfg.resolution != Resolution.FETCH.value:
                 print(f"Using resolution: {cfg.resolution}")
@@ -1633,42 +2550,42 @@ def _configure_interactive(transcriber):
 
         if cfg.resolution == Resolution.FETCH.value:
             try:
-                yt = YouTube(cfg.url, "WEB")
+                yt = transcriber.get_youtube_object(cfg.url)
             except RegexMatchError:
                 print("Error: Invalid YouTube URL.")
                 sys.exit()
             cfg.selected_res = _prompt_resolution_selection(transcriber, yt)
 
         cfg.download_audio = _bool_from_last(
-            "LAST_DOWNLOAD_AUDIO",
-            lambda: transcriber.get_yes_no_input("Download audio? (y/N): ", default='n'))
-        used_fields["DOWNLOAD_AUDIO"] = "y" if cfg.download_audio else "n"
+            repeat_state, "DOWNLOAD_AUDIO",
+            lambda: transcriber.get_yes_no_input("Download audio? (y/N): ", default='n'),
+            used_fields)
 
     cfg.transcribe_audio = _bool_from_last(
-        "LAST_TRANSCRIBE_AUDIO",
-        lambda: transcriber.get_yes_no_input("Transcribe the audio? (Y/n): "))
-    used_fields["TRANSCRIBE_AUDIO"] = "y" if cfg.transcribe_audio else "n"
+        repeat_state, "TRANSCRIBE_AUDIO",
+        lambda: transcriber.get_yes_no_input("Transcribe the audio? (Y/n): "), used_fields)
 
     if not cfg.transcribe_audio:
         return cfg
 
-    cfg.model_choice = _value_from_last("LAST_MODEL_CHOICE", transcriber.get_model_choice_input)
+    cfg.model_choice = _value_from_last(repeat_state, "MODEL_CHOICE",
+                                        transcriber.get_model_choice_input)
     model_enum = ModelSize.from_choice(cfg.model_choice)
     cfg.model_name = model_enum.value
     used_fields["MODEL_CHOICE"] = cfg.model_name
 
-    cfg.target_language = _value_from_last("LAST_TARGET_LANGUAGE", transcriber.get_target_language_input)
+    cfg.target_language = _value_from_last(repeat_state, "TARGET_LANGUAGE",
+                                           transcriber.get_target_language_input)
     used_fields["TARGET_LANGUAGE"] = cfg.target_language
 
-    if model_enum in ModelSize.standard_models() and cfg.target_language == transcriber.DEFAULT_LANGUAGE:
+    if model_enum in _STANDARD_MODELS and cfg.target_language == transcriber.DEFAULT_LANGUAGE:
         cfg.use_en_model = _bool_from_last(
-            "LAST_USE_EN_MODEL",
+            repeat_state, "USE_EN_MODEL",
             lambda: transcriber.get_yes_no_input(
                 "Use English-specific model? (Recommended only if the video is originally in English) (y/N): ",
-                default='n'))
-        used_fields["USE_EN_MODEL"] = "y" if cfg.use_en_model else "n"
+                default='n'), used_fields)
 
-    last_ai = os.environ.get("LAST_AI_ENHANCEMENT")
+    last_ai = repeat_state.last.get("AI_ENHANCEMENT")
     if last_ai is not None:
         cfg.ai_mode, cfg.provider, cfg.local_model = _ai_mode_from_setting(last_ai)
         print(f"Using previous AI_ENHANCEMENT: {last_ai} (from last session)")
@@ -1698,49 +2615,71 @@ def _configure_interactive(transcriber):
     return cfg
 
 
-def _configure_from_profile(transcriber, profile_name):
+def _configure_repeat(transcriber, previous):
+    """Settings for a repeat session: the previous session's, with a new source.
+
+    Skips re-reading and re-validating every field; only the URL (and, for
+    FETCH, the resolution of the new video) is asked for again.
+    """
+    cfg = replace(previous, url=None, is_local_file=False, yt=None, video_title="",
+                  selected_res=None, used_fields=previous.used_fields.copy())
+    print("Reusing the previous session's settings.")
+    cfg.url, cfg.is_local_file = transcriber.prompt_for_source()
+
+    if not cfg.is_local_file:
+        transcriber.prefetch_metadata_async(cfg.url)
+        if cfg.download_video and cfg.resolution == Resolution.FETCH.value:
+            try:
+                yt = transcriber.get_youtube_object(cfg.url)
+            except RegexMatchError:
+                print("Error: Invalid YouTube URL.")
+                sys.exit()
+            cfg.selected_res = _prompt_resolution_selection(transcriber, yt)
+    return cfg
+
+
+def _configure_from_profile(transcriber, profile_name, repeat_state):
     """Gather all session settings from the loaded profile's environment variables.
 
     Missing or invalid values fall back to interactive prompts.
     """
     cfg = SessionConfig(used_fields=transcriber.DEFAULT_FIELDS.copy())
+    # Every profile field read once, rather than one os.environ lookup per use
+    profile_env = {field: os.environ.get(field) for field in transcriber.DEFAULT_FIELDS}
 
-    repeat_invocation = os.environ.get("_REPEAT_INVOCATION", "") == "1"
     # On repeat, ignore the profile URL so the user is asked for a fresh one.
     # A missing URL field behaves like the placeholder: prompt for it later.
-    if repeat_invocation:
+    if repeat_state.active:
         cfg.url = transcriber.URL_PLACEHOLDER
     else:
-        cfg.url = os.getenv("URL") or transcriber.URL_PLACEHOLDER
+        cfg.url = profile_env["URL"] or transcriber.URL_PLACEHOLDER
 
     if cfg.url != transcriber.URL_PLACEHOLDER:
-        # An existing local file wins over an ID-lookalike filename
-        if transcriber.is_youtube_video_id(cfg.url) and not os.path.exists(cfg.url):
-            cfg.url = transcriber.construct_youtube_url(cfg.url)
+        kind, url = transcriber.classify_source(cfg.url)
+        if kind == SourceKind.VIDEO_ID:
+            cfg.url = url
             print(f"Detected video ID from profile, using: {cfg.url}")
             try:
-                YouTube(cfg.url, "WEB")
+                transcriber.get_youtube_object(cfg.url)
                 print(f"Loaded YOUTUBE_URL: {cfg.url} (from {profile_name})")
             except RegexMatchError:
-                print("Error creating YouTube object. Please enter a valid URL or video ID.")
-                cfg.url = input()
-        elif transcriber.is_web_url(cfg.url):
-            if transcriber.is_youtube_url(cfg.url):
-                try:
-                    YouTube(cfg.url, "WEB")
-                    print(f"Loaded YOUTUBE_URL: {cfg.url} (from {profile_name})")
-                except RegexMatchError:
-                    # Use ffprobe to determine if it's a valid audio/video file
-                    if transcriber.get_file_format(cfg.url):
-                        cfg.is_local_file = True
-                        print(f"Loaded local file: {cfg.url} (from {profile_name})")
-                    else:
-                        print("Incorrect value for YOUTUBE_URL in config.env. "
-                              "Please enter a valid YouTube video URL, video ID, or local file path: ")
-                        cfg.url = input()
-            else:
-                print("Error: Only YouTube URLs supported for web inputs")
-        elif transcriber.is_valid_media_file(cfg.url):
+                print("Error creating YouTube object.")
+                cfg.url, cfg.is_local_file = transcriber.prompt_for_source()
+        elif kind == SourceKind.YOUTUBE_URL:
+            try:
+                transcriber.get_youtube_object(cfg.url)
+                print(f"Loaded YOUTUBE_URL: {cfg.url} (from {profile_name})")
+            except RegexMatchError:
+                # Use ffprobe to determine if it's a valid audio/video file
+                if transcriber.get_file_format(cfg.url):
+                    cfg.is_local_file = True
+                    print(f"Loaded local file: {cfg.url} (from {profile_name})")
+                else:
+                    print("Incorrect value for YOUTUBE_URL in config.env.")
+                    cfg.url, cfg.is_local_file = transcriber.prompt_for_source()
+        elif kind == SourceKind.OTHER_WEB_URL:
+            print("Error: Only YouTube URLs supported for web inputs")
+        elif kind == SourceKind.LOCAL_FILE:
             cfg.is_local_file = True
             print(f"Loaded local file: {cfg.url} (from {profile_name})")
         else:
@@ -1748,29 +2687,31 @@ def _configure_from_profile(transcriber, profile_name):
             cfg.url, cfg.is_local_file = transcriber.prompt_for_source()
 
     if not cfg.is_local_file:
+        if cfg.url != transcriber.URL_PLACEHOLDER:
+            transcriber.prefetch_metadata_async(cfg.url)
         cfg.download_video = _bool_from_profile_env(
-            transcriber, "DOWNLOAD_VIDEO", profile_name,
+            transcriber, profile_env, "DOWNLOAD_VIDEO", profile_name,
             "Download video stream? (y/N): ", default='n')
 
         if cfg.download_video:
             cfg.no_audio_in_video = _bool_from_profile_env(
-                transcriber, "NO_AUDIO_IN_VIDEO", profile_name,
+                transcriber, profile_env, "NO_AUDIO_IN_VIDEO", profile_name,
                 "Download the video without audio? (y/N): ", default='n', prompt_if_missing=False)
 
-            resolution = os.getenv("RESOLUTION")
+            resolution = profile_env["RESOLUTION"]
             if resolution:
                 resolution = resolution.lower()
-                if resolution not in Resolution.values():
-                    if resolution.isdigit():
-                        if int(resolution) > 0:
-                            resolution += "p"
-                            print(f"Loaded RESOLUTION: {resolution} (from {profile_name})")
-                        else:
-                            print(f"Invalid value for RESOLUTION in .env: {resolution}")
-                            resolution = None
-                    elif not (resolution.endswith("p") and resolution[:-1].isdigit()):
+                if resolution not in _RESOLUTION_VALUES:
+                    match = _RESOLUTION_RE.fullmatch(resolution)
+                    if match is None:
                         print(f"Invalid value for RESOLUTION in .env: {resolution}")
                         resolution = Resolution.FETCH.value
+                    elif int(match.group(1)) > 0:
+                        resolution = f"{int(match.group(1))}p"
+                        print(f"Loaded RESOLUTION: {resolution} (from {profile_name})")
+                    else:
+                        print(f"Invalid value for RESOLUTION in .env: {resolution}")
+                        resolution = None
                 else:
                     print(f"Loaded RESOLUTION: {resolution} (from {profile_name})")
             cfg.resolution = resolution
@@ -1781,7 +2722,7 @@ def _configure_from_profile(transcriber, profile_name):
             cfg.url, cfg.is_local_file = transcriber.prompt_for_source()
         if not cfg.is_local_file:
             try:
-                yt = YouTube(cfg.url, "WEB")
+                yt = transcriber.get_youtube_object(cfg.url)
             except RegexMatchError:
                 print("Error: Invalid YouTube URL.")
                 sys.exit()
@@ -1789,14 +2730,14 @@ def _configure_from_profile(transcriber, profile_name):
 
     if not cfg.is_local_file:
         cfg.download_audio = _bool_from_profile_env(
-            transcriber, "DOWNLOAD_AUDIO", profile_name,
+            transcriber, profile_env, "DOWNLOAD_AUDIO", profile_name,
             "Download audio only? (y/N): ", default='n', prompt_if_missing=False)
 
     cfg.transcribe_audio = _bool_from_profile_env(
-        transcriber, "TRANSCRIBE_AUDIO", profile_name,
+        transcriber, profile_env, "TRANSCRIBE_AUDIO", profile_name,
         "Transcribe the audio? (Y/n): ", default='y')
 
-    model_choice = os.getenv("MODEL_CHOICE")
+    model_choice = profile_env["MODEL_CHOICE"]
     if model_choice and cfg.transcribe_audio:
         if model_choice.lower() not in ModelSize.valid_choices():
             print(f"Invalid value for MODEL_CHOICE in .env: {model_choice}")
@@ -1814,33 +2755,36 @@ def _configure_from_profile(transcriber, profile_name):
         if cfg.url == transcriber.URL_PLACEHOLDER:
             cfg.url, cfg.is_local_file = transcriber.prompt_for_source()
 
-        target_language = os.getenv("TARGET_LANGUAGE")
+        target_language = profile_env["TARGET_LANGUAGE"]
         if target_language:
-            if target_language.lower() not in whisper.tokenizer.LANGUAGES:
+            language_code = _language_code(target_language)
+            if language_code is None:
                 print(f"Invalid value for TARGET_LANGUAGE in .env: {target_language}")
-                target_language = transcriber.get_target_language_input()
+                language_code = transcriber.get_target_language_input()
             else:
                 print(f"Loaded TARGET_LANGUAGE: {target_language} (from {profile_name})")
         else:
-            target_language = transcriber.get_target_language_input()
-        cfg.target_language = target_language
+            language_code = transcriber.get_target_language_input()
+        cfg.target_language = language_code
 
-        use_en_model_str = os.getenv("USE_EN_MODEL")
+        use_en_model_str = profile_env["USE_EN_MODEL"]
         if use_en_model_str:
-            if use_en_model_str.lower() in YesNo.YES.value:
+            use_en_model_lower = use_en_model_str.lower()
+            if use_en_model_lower in YesNo.YES.value:
                 cfg.use_en_model = True
                 print(f"Loaded USE_EN_MODEL: {use_en_model_str} (from {profile_name})")
-            elif use_en_model_str.lower() in YesNo.NO.value:
+            elif use_en_model_lower in YesNo.NO.value:
                 cfg.use_en_model = False
                 print(f"Loaded USE_EN_MODEL: {use_en_model_str} (from {profile_name})")
             else:
                 print(f"Invalid value for USE_EN_MODEL in .env: {use_en_model_str}")
-                if model_enum in ModelSize.standard_models() and cfg.target_language == transcriber.DEFAULT_LANGUAGE:
+                if (model_enum in _STANDARD_MODELS
+                        and cfg.target_language == transcriber.DEFAULT_LANGUAGE):
                     cfg.use_en_model = transcriber.get_yes_no_input(
                         "Use English-specific model? (Recommended only if the video is originally in English) (y/N): ",
                         default='n')
 
-    ai_enhancement_str = os.getenv("AI_ENHANCEMENT")
+    ai_enhancement_str = profile_env["AI_ENHANCEMENT"]
     if ai_enhancement_str and cfg.transcribe_audio:
         cfg.ai_mode, cfg.provider, cfg.local_model = _ai_mode_from_setting(ai_enhancement_str)
         print(f"Loaded AI_ENHANCEMENT: {ai_enhancement_str} (from {profile_name})")
@@ -1848,7 +2792,7 @@ def _configure_from_profile(transcriber, profile_name):
         cfg.ai_mode, cfg.provider, cfg.local_model = transcriber.get_ai_enhancement_input()
 
     if cfg.ai_mode is not None and cfg.transcribe_audio:
-        prompt_env = (os.getenv("PROMPT") or "").strip()
+        prompt_env = (profile_env["PROMPT"] or "").strip()
         available_prompts = transcriber.list_available_prompts()
         if prompt_env and prompt_env in available_prompts:
             cfg.prompt_text = transcriber.load_prompt_file(prompt_env)
@@ -1904,8 +2848,47 @@ def _create_youtube_with_recovery(transcriber, cfg):
                 return
 
 
+def _download_video_stream(transcriber, stream, no_audio_in_video, video_filename):
+    """Download the selected video stream.
+
+    A video-only download is final and goes straight to VideoWithoutAudio/;
+    otherwise the file lands in a temp dir to be combined with the audio.
+
+    Returns:
+        tuple: (video_path, video_temp_dir), both None for a video-only download.
+    """
+    if no_audio_in_video:
+        print(f"Downloading video stream ({stream.resolution} without audio)...")
+        transcriber.download_stream(stream, transcriber.VIDEO_WITHOUT_AUDIO_DIR, video_filename)
+        file_path = os.path.abspath(
+            os.path.join(transcriber.VIDEO_WITHOUT_AUDIO_DIR, video_filename))
+        print(f"Video downloaded to {file_path}")
+        return None, None
+
+    video_temp_dir = os.path.join(transcriber.VIDEO_DIR, transcriber.TEMP_DIR)
+    os.makedirs(video_temp_dir, exist_ok=True)
+    video_path = transcriber.download_stream(stream, video_temp_dir, video_filename)
+    print(f"Video downloaded to {video_path}")
+    return video_path, video_temp_dir
+
+
+def _effective_model_name(transcriber, cfg):
+    """Whisper model to load for this session, including the English-only variant."""
+    # English-specific variants (e.g. base.en) exist for the standard sizes only
+    model_name = cfg.model_name
+    if (cfg.use_en_model and cfg.target_language == transcriber.DEFAULT_LANGUAGE
+            and model_name in _STANDARD_MODEL_NAMES):
+        model_name += ".en"
+    return model_name
+
+
 def _run_pipeline(transcriber, cfg):
     """Execute the session: download streams, transcribe, enhance, and save."""
+    if cfg.transcribe_audio:
+        # Load the weights while the streams download; transcription picks them up later
+        model_name = _effective_model_name(transcriber, cfg)
+        transcriber.preload_whisper_model(model_name, cfg.target_language)
+
     if not cfg.is_local_file and (not cfg.url or cfg.url == transcriber.URL_PLACEHOLDER):
         cfg.url, cfg.is_local_file = transcriber.prompt_for_source()
 
@@ -1920,63 +2903,65 @@ def _run_pipeline(transcriber, cfg):
     print(f"\nProcessing: {display_source}...")
 
     video_filename = filename_base + transcriber.MP4_EXT
-    audio_filename = filename_base + transcriber.MP3_EXT
     video_temp_dir = None
     video_path = None
+    video_stream = None
+    audio_path = None
 
     if cfg.download_video and not cfg.is_local_file:
         yt = cfg.yt
+        # Sorted once; every branch below and the fallback picker reuse it
+        streams = transcriber.get_sorted_video_streams(yt)
         match cfg.resolution:
             case Resolution.HIGHEST.value:
-                streams = transcriber.get_sorted_video_streams(yt)
                 stream = streams[0] if streams else None
 
             case Resolution.LOWEST.value:
-                streams = transcriber.get_sorted_video_streams(yt)
                 stream = streams[-1] if streams else None
 
             case Resolution.FETCH.value:
-                stream = yt.streams.filter(only_video=True, resolution=cfg.selected_res).first()
+                stream = _first_stream_at(streams, cfg.selected_res)
 
             case _:
-                streams = transcriber.sort_streams_by_resolution(
-                    yt.streams.filter(only_video=True, resolution=cfg.resolution))
-                stream = streams[0] if streams else None
+                stream = _first_stream_at(streams, cfg.resolution)
 
         if stream is None:
             print("Requested resolution not found, left null, or invalid.")
-            cfg.selected_res = _prompt_resolution_selection(transcriber, yt)
-            stream = yt.streams.filter(only_video=True, resolution=cfg.selected_res).first()
+            cfg.selected_res = _prompt_resolution_selection(transcriber, yt, streams)
+            stream = _first_stream_at(streams, cfg.selected_res)
             if stream is None:
                 print(f"Error: No suitable stream found for resolution {cfg.selected_res}. Exiting...")
                 sys.exit()
-
-        if cfg.no_audio_in_video:
-            print(f"Downloading video stream ({stream.resolution} without audio)...")
-            stream.download(output_path=transcriber.VIDEO_WITHOUT_AUDIO_DIR, filename=video_filename)
-            file_path = os.path.abspath(os.path.join(transcriber.VIDEO_WITHOUT_AUDIO_DIR, video_filename))
-            print(f"Video downloaded to {file_path}")
-        else:
-            video_temp_dir = os.path.join(transcriber.VIDEO_DIR, transcriber.TEMP_DIR)
-            os.makedirs(video_temp_dir, exist_ok=True)
-            stream.download(output_path=video_temp_dir, filename=video_filename)
-            video_path = os.path.join(video_temp_dir, video_filename)
-            print(f"Video downloaded to {video_path}")
+        video_stream = stream
     else:
         print("Skipping video download...")
 
-    if cfg.download_audio and not cfg.is_local_file:
-        transcriber.download_audio_stream(cfg.yt, filename_base, is_temp=False)
-    elif cfg.download_audio:
+    if cfg.download_audio and cfg.is_local_file:
         # Source switched to a local file mid-run; there is no stream to download
         print("Skipping audio download (source is a local file).")
 
-    if cfg.download_video and not cfg.is_local_file and not cfg.no_audio_in_video:
-        if not cfg.download_audio:
-            audio_path, _ = transcriber.download_audio_stream(cfg.yt, filename_base, is_temp=True)
-        else:
-            audio_path = os.path.join(transcriber.AUDIO_DIR, audio_filename)
-
+    needs_combine = video_stream is not None and not cfg.no_audio_in_video
+    # One audio download serves the kept file, the combine step and transcription alike
+    fetch_audio = not cfg.is_local_file and (
+        cfg.download_audio or needs_combine or cfg.transcribe_audio)
+
+    # Video and audio are separate streams on separate connections; fetching
+    # them side by side makes the download phase take max(video, audio), not the sum
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        video_future = audio_future = None
+        if video_stream is not None:
+            video_future = pool.submit(_download_video_stream, transcriber, video_stream,
+                                       cfg.no_audio_in_video, video_filename)
+        if fetch_audio:
+            # Audio the user didn't ask to keep goes to a temp copy, removed at the end
+            audio_future = pool.submit(transcriber.download_audio_stream, cfg.yt, filename_base,
+                                       is_temp=not cfg.download_audio)
+        if video_future is not None:
+            video_path, video_temp_dir = video_future.result()
+        if audio_future is not None:
+            audio_path, _ = audio_future.result()
+
+    if needs_combine:
         output_path_combined = os.path.join(transcriber.VIDEO_DIR, video_filename)
         transcriber.combine_audio_video(video_path, audio_path, output_path_combined,
                 cleanup_temp=not cfg.no_audio_in_video, temp_video_dir=video_temp_dir)
@@ -1987,31 +2972,12 @@ def _run_pipeline(transcriber, cfg):
                 audio_file = cfg.url
             else:
                 # Extract the audio track from a local video file
-                try:
-                    video = VideoFileClip(cfg.url)
-                    audio_file = os.path.join(transcriber.AUDIO_DIR, filename_base + transcriber.MP3_EXT)
-                    try:
-                        if video.audio is None:
-                            print("Error: Video file has no audio track.")
-                            sys.exit(1)
-                        video.audio.write_audiofile(audio_file)
-                    finally:
-                        video.close()
-                except (IOError, OSError, ValueError, AttributeError) as e:
-                    print(f"Error processing video file: {str(e)}")
+                audio_file = transcriber.extract_audio_track(cfg.url, filename_base)
+                if audio_file is None:
                     sys.exit(1)
             file_path = audio_file
         else:
-            audio_file = os.path.join(transcriber.AUDIO_DIR, audio_filename)
-            if not cfg.download_audio:
-                audio_file, _ = transcriber.download_audio_stream(cfg.yt, filename_base, is_temp=True)
-            file_path = audio_file
-
-        # English-specific variants (e.g. base.en) exist for the standard sizes only
-        model_name = cfg.model_name
-        if (cfg.use_en_model and cfg.target_language == transcriber.DEFAULT_LANGUAGE
-                and model_name in tuple(size.value for size in ModelSize.standard_models())):
-            model_name += ".en"
+            file_path = audio_path
 
         transcribed_text, language = transcriber.transcribe_audio_file(
             file_path, model_name, cfg.target_language
@@ -2032,52 +2998,59 @@ def _run_pipeline(transcriber, cfg):
             transcript_name = f"{filename_base}{transcriber.TXT_EXT}"
         else:
             transcript_name = f"{filename_base} [{language}]{transcriber.TXT_EXT}"
-        transcriber.create_and_open_txt(transcribed_text, transcript_name)
-        print(f"Saved transcript to {os.path.abspath(os.path.join(transcriber.TRANSCRIPT_DIR, transcript_name))}")
+        transcript_path = transcriber.create_and_open_txt(transcribed_text, transcript_name)
+        if transcript_path is not None:
+            print(f"Saved transcript to {os.path.abspath(transcript_path)}")
     else:
         print("Skipping transcription.")
 
-    # Clean up the temp audio downloaded solely for transcription/combining
-    temp_audio_path = os.path.join(transcriber.AUDIO_DIR, transcriber.TEMP_DIR)
-    temp_audio_file = os.path.join(temp_audio_path, filename_base + transcriber.MP3_EXT)
-    if (not cfg.is_local_file and not cfg.download_audio
-            and (cfg.transcribe_audio or cfg.download_video)
-            and os.path.exists(temp_audio_file)):
-        os.remove(temp_audio_file)
-        if os.path.exists(temp_audio_path) and not os.listdir(temp_audio_path):
-            os.rmdir(temp_audio_path)
-        print(f"Deleted audio residual in {temp_audio_file}")
+    # Clean up the temp audio downloaded solely for transcription/combining.
+    # Only a fetch the user didn't ask to keep went to Temp/, so no stat is
+    # needed to tell whether there is anything to remove.
+    if fetch_audio and not cfg.download_audio and audio_path:
+        try:
+            os.remove(audio_path)
+            print(f"Deleted audio residual in {audio_path}")
+            os.rmdir(os.path.dirname(audio_path))
+        except OSError:
+            pass  # already gone, or Temp/ still holds other files
 
     print("Tasks complete.")
 
 
-def _ask_repeat(transcriber):
+def _ask_repeat(transcriber, repeat_state):
     """Ask the user whether to run again; the default flips to yes after the first repeat."""
-    repeat_ask_count = int(os.environ.get("_REPEAT_ASK_COUNT", "0"))
-    default_repeat = 'y' if repeat_ask_count > 0 else 'n'
+    default_repeat = 'y' if repeat_state.ask_count > 0 else 'n'
     prompt_text = "Run again? (Y/n): " if default_repeat == 'y' else "Run again? Hit Enter to repeat (y/N): "
     repeat = transcriber.get_yes_no_input(prompt_text, default=default_repeat)
-    os.environ["_REPEAT_ASK_COUNT"] = str(repeat_ask_count + 1)
+    repeat_state.ask_count += 1
     return repeat, ("y" if repeat else "n")
 
 
-def _finish_session(transcriber, cfg, load_profile, profile_name):
-    """Handle profile creation and the "Run again?" repeat loop."""
+def _finish_session(transcriber, cfg, load_profile, profile_name, repeat_state):
+    """Handle profile creation and the "Run again?" question.
+
+    Updates repeat_state for the next session when repeating.
+
+    Returns:
+        bool: True if main() should run another session.
+    """
     did_something_useful = cfg.download_audio or cfg.download_video or cfg.transcribe_audio
-    is_repeat = os.environ.get("_REPEAT_INVOCATION", "") == "1"
+    is_repeat = repeat_state.active
 
     repeat = False
     repeat_value = ""
     try:
-        repeat_setting = (os.getenv("REPEAT", "") or "") if load_profile else ""
-        if load_profile and repeat_setting.lower() in YesNo.YES.value:
+        repeat_setting = (os.getenv("REPEAT", "") or "").lower() if load_profile else ""
+        if load_profile and repeat_setting in YesNo.YES.value:
             repeat, repeat_value = True, "y"
-        elif load_profile and repeat_setting.lower() in YesNo.NO.value:
+        elif load_profile and repeat_setting in YesNo.NO.value:
             repeat, repeat_value = False, "n"
         else:
             # Blank or invalid REPEAT setting, or interactive mode -> ask the user
-            repeat, repeat_value = _ask_repeat(transcriber)
-    except Exception:
+            repeat, repeat_value = _ask_repeat(transcriber, repeat_state)
+    except EOFError:
+        # stdin closed (e.g. a piped session ran out of answers): stop here
         repeat, repeat_value = False, ""
 
     cfg.used_fields["REPEAT"] = repeat_value
@@ -2086,39 +3059,38 @@ def _finish_session(transcriber, cfg, load_profile, profile_name):
         if transcriber.get_yes_no_input("Do you want to create a profile from this session? (y/N): ", default='n'):
             transcriber.create_profile(cfg.used_fields)
 
-    try:
-        if repeat:
-            if not load_profile:
-                # Remember this session's answers so the repeat run can reuse them
-                if cfg.ai_mode == AIEnhancementMode.API:
-                    last_ai = cfg.provider.key
-                elif cfg.ai_mode == AIEnhancementMode.LOCAL:
-                    last_ai = cfg.local_model if cfg.local_model else "local"
-                else:
-                    last_ai = "n"
-                os.environ.update({
-                    "LAST_DOWNLOAD_VIDEO": "y" if cfg.download_video else "n",
-                    "LAST_NO_AUDIO_IN_VIDEO": "y" if cfg.no_audio_in_video else "n",
-                    "LAST_RESOLUTION": cfg.resolution or "",
-                    "LAST_DOWNLOAD_AUDIO": "y" if cfg.download_audio else "n",
-                    "LAST_TRANSCRIBE_AUDIO": "y" if cfg.transcribe_audio else "n",
-                    "LAST_MODEL_CHOICE": cfg.model_choice or "",
-                    "LAST_TARGET_LANGUAGE": cfg.target_language or "",
-                    "LAST_USE_EN_MODEL": "y" if cfg.use_en_model else "n",
-                    "LAST_AI_ENHANCEMENT": last_ai,
+    if repeat:
+        if not load_profile:
+            # Remember this session's answers so the repeat run can reuse them
+            if cfg.ai_mode == AIEnhancementMode.API:
+                last_ai = cfg.provider.key
+            elif cfg.ai_mode == AIEnhancementMode.LOCAL:
+                last_ai = cfg.local_model if cfg.local_model else "local"
+            else:
+                last_ai = "n"
+            repeat_state.last = {
+                "TRANSCRIBE_AUDIO": "y" if cfg.transcribe_audio else "n",
+                "MODEL_CHOICE": cfg.model_choice or "",
+                "TARGET_LANGUAGE": cfg.target_language or "",
+                "USE_EN_MODEL": "y" if cfg.use_en_model else "n",
+                "AI_ENHANCEMENT": last_ai,
+            }
+            # A local-file session never asked the download questions, so its
+            # "n" defaults must not be replayed for a YouTube source next time
+            if not cfg.is_local_file:
+                repeat_state.last.update({
+                    "DOWNLOAD_VIDEO": "y" if cfg.download_video else "n",
+                    "NO_AUDIO_IN_VIDEO": "y" if cfg.no_audio_in_video else "n",
+                    "RESOLUTION": cfg.resolution or "",
+                    "DOWNLOAD_AUDIO": "y" if cfg.download_audio else "n",
                 })
-            os.environ["_REPEAT_INVOCATION"] = "1"
-            os.environ["URL"] = transcriber.URL_PLACEHOLDER
-            if load_profile and profile_name:
-                os.environ["_REPEAT_PROFILE_NAME"] = profile_name
-            print("Repeating session as requested...")
-            main()
-        else:
-            _clear_session_env()
-    except Exception:
-        # Clean up repeat state, but never hide the error from the user
-        _clear_session_env()
-        raise
+        repeat_state.active = True
+        # For the same reason a local-file session can't be replayed whole
+        repeat_state.previous = None if cfg.is_local_file else cfg
+        if load_profile and profile_name:
+            repeat_state.profile_name = profile_name
+        print("Repeating session as requested...")
+    return repeat
 
 
 def main():
@@ -2136,15 +3108,21 @@ def main():
             print("Please check permissions and try again.")
             sys.exit(1)
 
-    load_profile, profile_name = _select_profile(transcriber)
+    # Repeats stay in this process, so loaded models and imports carry over
+    repeat_state = RepeatState()
+    while True:
+        load_profile, profile_name = _select_profile(transcriber, repeat_state)
 
-    if load_profile:
-        cfg = _configure_from_profile(transcriber, profile_name)
-    else:
-        cfg = _configure_interactive(transcriber)
+        if repeat_state.previous is not None:
+            cfg = _configure_repeat(transcriber, repeat_state.previous)
+        elif load_profile:
+            cfg = _configure_from_profile(transcriber, profile_name, repeat_state)
+        else:
+            cfg = _configure_interactive(transcriber, repeat_state)
 
-    _run_pipeline(transcriber, cfg)
-    _finish_session(transcriber, cfg, load_profile, profile_name)
+        _run_pipeline(transcriber, cfg)
+        if not _finish_session(transcriber, cfg, load_profile, profile_name, repeat_state):
+            break
 
 
 if __name__ == "__main__":
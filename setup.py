@@ -30,12 +30,12 @@ setup(
     install_requires=[
         "requests",
         "py_mini_racer",
-        "langdetect",
         "pytubefix",
         "python-dotenv",
         "moviepy",
         "tenacity",
            "openai-whisper @ git+https://github.com/openai/whisper.git",
+        "faster-whisper",
     ],
     entry_points={
         "console_scripts": [